@@ -3,203 +3,607 @@
 Script to automatically add SEO metadata to tool and game components
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+from component_index import INDEX_FILE, build_component_index
+from seo_compact import COMPACT_METADATA_FILE, read_compact_metadata, render_records
+
+TOOL_METADATA_JSON = "tool_metadata.json"
+GAME_METADATA_JSON = "game_metadata.json"
+TOOL_METADATA_NDJSON = "tool_metadata.ndjson"
+GAME_METADATA_NDJSON = "game_metadata.ndjson"
+
+# Tasks handed to the worker pool per worker at a time, bounding memory
+# when metadata is streamed from a large catalog
+TASK_BATCH_SIZE = 256
+
+# Manifest of component/metadata hashes used to skip unchanged files
+CACHE_FILE = ".seo_cache.json"
+
+# Bump whenever the injected markup or insertion rules change so that
+# previously cached components are re-processed
+CACHE_VERSION = 3
+
+# Per-file outcomes reported by patch_component
+STATUSES = ("patched", "already-present", "no-match", "cached", "error")
+
+HELMET_IMPORT = "import { Helmet } from 'react-helmet';"
+
+# Tokens seen by scan_component. Comments and string literals are consumed
+# whole so that nothing inside them is mistaken for code. The leading
+# lookahead lets the engine skip ordinary characters without trying every
+# alternative at each position.
+SCAN_TOKENS = re.compile(r"""
+    (?=[/'"`i<r{}])
+    (?:
+        (?P<comment>//[^\n]*|/\*.*?\*/)
+      | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+      | (?P<import>^import\b)
+      | (?P<helmet><Helmet\b)
+      | (?P<return>\breturn\b)
+      | (?P<open>\{)
+      | (?P<close>\})
+    )
+""", re.S | re.M | re.X)
+
+# A full import statement, possibly spanning several lines
+IMPORT_STATEMENT = re.compile(r"""import\b[^;'"]*?(['"])[^'"\n]*\1;?""")
+
+HELMET_BINDING = re.compile(r"\bHelmet\b")
+
+# ``return (`` followed by a <div ...> or <> fragment root
+RETURN_ROOT = re.compile(r"\s*\(\s*(<>|<div\b)")
+
+# A Helmet block exactly as build_helmet_component renders it, so blocks this
+# script inserted can be refreshed while hand-written ones are left alone
+GENERATED_HELMET = re.compile(
+    r"      <Helmet>\n"
+    r"        <title>[^\n]*</title>\n"
+    r"        <meta name=\"description\" content=\"[^\n]*\" />\n"
+    r"        <meta name=\"keywords\" content=\"[^\n]*\" />\n"
+    r"        <meta name=\"author\" content=\"Edurance Hub\" />\n"
+    r"      </Helmet>"
+)
+
+# Opt-out marker for components whose SEO a parent such as ToolDetail renders;
+# put it in a comment, e.g. // seo:helmet-delegated
+HELMET_DELEGATED = re.compile(r"\bseo:helmet-delegated\b")
+
+def read_json(path):
+    """Read a JSON artifact, recording its size and parse time"""
+    with open(path, "r") as f:
+        payload = f.read()
+    instrumentation.add("bytes_read", len(payload))
+    with instrumentation.timer("json_seconds"):
+        return json.loads(payload)
 
 def read_tool_metadata():
     """Read the generated tool metadata"""
-    with open("tool_metadata.json", "r") as f:
-        return json.load(f)
+    return read_json(TOOL_METADATA_JSON)
 
 def read_game_metadata():
     """Read the generated game metadata"""
-    with open("game_metadata.json", "r") as f:
-        return json.load(f)
+    return read_json(GAME_METADATA_JSON)
 
-def add_seo_to_tool_component(file_path, metadata):
-    """Add SEO metadata to a tool component"""
+def iter_ndjson(path):
+    """Lazily yield records from a newline-delimited JSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                instrumentation.add("bytes_read", len(line))
+                with instrumentation.timer("json_seconds"):
+                    record = json.loads(line)
+                yield record
+
+def current_artifact(paths):
+    """Return the path of the artifact format written last, given a format ->
+    path mapping, or None if that file is missing. Before any run has recorded
+    a format, the checked-in JSON is used"""
+    path = paths.get(seo_optimization.current_metadata_artifact() or "json")
+    if path is None or not os.path.exists(path):
+        return None
+    return path
+
+def iter_compact_records(kind):
+    """Yield full records expanded from the compact artifact"""
+    dictionary, tool_records, game_records = read_compact_metadata(COMPACT_METADATA_FILE)
+    yield from render_records(tool_records if kind == "tool" else game_records, dictionary)
+
+def iter_tool_records():
+    """Yield tool metadata records from the artifact written last (compact,
+    NDJSON or JSON), generating them in-process when it is missing"""
+    path = current_artifact({"compact": COMPACT_METADATA_FILE, "ndjson": TOOL_METADATA_NDJSON,
+                             "json": TOOL_METADATA_JSON})
+    if path is None:
+        yield from seo_optimization.iter_tool_metadata()
+    elif path == COMPACT_METADATA_FILE:
+        yield from iter_compact_records("tool")
+    elif path == TOOL_METADATA_NDJSON:
+        yield from iter_ndjson(path)
+    else:
+        for tools in read_tool_metadata().values():
+            yield from tools
+
+def iter_game_records():
+    """Yield game metadata records from the artifact written last (compact,
+    NDJSON or JSON), generating them in-process when it is missing"""
+    path = current_artifact({"compact": COMPACT_METADATA_FILE, "ndjson": GAME_METADATA_NDJSON,
+                             "json": GAME_METADATA_JSON})
+    if path is None:
+        yield from seo_optimization.iter_game_metadata()
+    elif path == COMPACT_METADATA_FILE:
+        yield from iter_compact_records("game")
+    elif path == GAME_METADATA_NDJSON:
+        yield from iter_ndjson(path)
+    else:
+        yield from read_game_metadata()
+
+def hash_bytes(data):
+    """Return the hex SHA-256 digest of a bytes payload"""
+    return hashlib.sha256(data).hexdigest()
+
+def hash_metadata(metadata):
+    """Hash a metadata record independent of key order"""
+    payload = json.dumps(metadata, sort_keys=True).encode("utf-8")
+    return hash_bytes(payload)
+
+def load_cache(path=CACHE_FILE):
+    """Load the component manifest, starting fresh if it is missing or stale"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Check if Helmet is already imported
-        if "import { Helmet } from 'react-helmet'" not in content:
-            # Add Helmet import after React import
-            content = re.sub(
-                r"(import React[^\n]*)",
-                r"\1\nimport { Helmet } from 'react-helmet';",
-                content,
-                1
-            )
-        
-        # Create Helmet component with metadata
-        helmet_component = f'''      <Helmet>
+        with open(path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "files": {}}
+    return cache
+
+def save_cache(cache, path=CACHE_FILE):
+    """Persist the component manifest atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def new_stats():
+    """Create empty cache and outcome counters for a run"""
+    stats = {"hits": 0, "misses": 0, "written": 0}
+    for status in STATUSES:
+        stats[status] = 0
+    return stats
+
+def build_helmet_component(metadata):
+    """Render the Helmet block inserted into components"""
+    return f'''      <Helmet>
         <title>{metadata['title']}</title>
         <meta name="description" content="{metadata['description']}" />
         <meta name="keywords" content="{metadata['keywords']}" />
         <meta name="author" content="Edurance Hub" />
       </Helmet>'''
-        
-        # Insert Helmet component at the beginning of the return statement
-        if "<Helmet>" not in content:
-            content = re.sub(
-                r"(\n\s*return\s*\(\s*\n\s*<div[^>]*>)",
-                f"\\1\n{helmet_component}",
-                content,
-                1
-            )
-        
-        # Write the updated content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        print(f"Successfully added SEO metadata to {file_path}")
-        return True
-    except Exception as e:
-        print(f"Error adding SEO metadata to {file_path}: {str(e)}")
-        return False
 
-def add_seo_to_game_component(file_path, metadata):
-    """Add SEO metadata to a game component"""
+def find_tag_end(content, start):
+    """Return the offset just past the opening tag starting at ``start``.
+
+    Quotes and ``{...}`` expressions inside the tag are skipped, so attributes
+    such as ``className={a > b ? 'x' : 'y'}`` do not end the tag early. Returns
+    None for self-closing or unterminated tags.
+    """
+    depth = 0
+    quote = None
+    i = start + 1
+    n = len(content)
+    while i < n:
+        c = content[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = None
+        elif c in "'\"`":
+            quote = c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif c == ">" and depth == 0:
+            return None if content[i - 1] == "/" else i + 1
+        i += 1
+    return None
+
+def find_jsx_root(content, pos):
+    """If ``return`` at ``pos`` is followed by ``(`` and a <div> or <> root,
+    return the offset just past that opening tag"""
+    match = RETURN_ROOT.match(content, pos)
+    if match is None:
+        return None
+    if match.group(1) == "<>":
+        return match.end()
+    return find_tag_end(content, match.start(1))
+
+def scan_component(content):
+    """Locate everything the SEO injector needs in a single pass over a component.
+
+    Strings and comments are skipped as whole tokens and brace depth is tracked,
+    so the JSX root is taken from the last ``return (`` directly inside the
+    component body rather than from a nested render helper. Returns a dict with:
+
+    - ``react_import`` / ``last_import``: end of the line holding the React
+      import / the last import statement
+    - ``helmet_import``: whether Helmet is already imported
+    - ``helmet_element``: offset of the first ``<Helmet>`` element, if any
+    - ``helmet_delegated``: whether a comment carries the seo:helmet-delegated marker
+    - ``root``: offset just past the opening tag of the JSX root
+    """
+    scan = {
+        "react_import": None,
+        "last_import": None,
+        "helmet_import": False,
+        "helmet_element": None,
+        "helmet_delegated": False,
+        "root": None
+    }
+    depth = 0
+    roots = {}
+    pos = 0
+
+    while True:
+        token = SCAN_TOKENS.search(content, pos)
+        if token is None:
+            break
+        kind = token.lastgroup
+        pos = token.end()
+
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+        elif kind == "comment":
+            if HELMET_DELEGATED.search(token.group()):
+                scan["helmet_delegated"] = True
+        elif kind == "helmet":
+            if scan["helmet_element"] is None:
+                scan["helmet_element"] = token.start()
+        elif kind == "return":
+            root = find_jsx_root(content, token.end())
+            if root is not None:
+                roots[depth] = root
+        elif kind == "import":
+            statement = IMPORT_STATEMENT.match(content, token.start())
+            if statement is None:
+                continue
+            pos = statement.end()
+            line_end = content.find("\n", pos)
+            if line_end == -1:
+                line_end = len(content)
+            scan["last_import"] = line_end
+            text = statement.group()
+            if scan["react_import"] is None and text.startswith("import React"):
+                scan["react_import"] = line_end
+            if HELMET_BINDING.search(text):
+                scan["helmet_import"] = True
+
+    # Depth 1 is the body of a top-level component; fall back to the
+    # shallowest return found
+    if roots:
+        scan["root"] = roots.get(1, roots[min(roots)])
+    return scan
+
+def inject_seo(content, metadata):
+    """Return component source with the Helmet import and block added, along
+    with the outcome status. The new source is built with a single join."""
+    scan = scan_component(content)
+    # (start, end, text) spans to replace; start == end for plain insertions
+    edits = []
+
+    helmet = scan["helmet_element"]
+    generated = None
+    if helmet is not None and helmet >= 6:
+        generated = GENERATED_HELMET.match(content, helmet - 6)
+
+    if generated is not None:
+        # Refresh a block we inserted earlier so metadata edits reach the component
+        block = build_helmet_component(metadata)
+        if generated.group() == block:
+            status = "already-present"
+        else:
+            status = "patched"
+            edits.append((generated.start(), generated.end(), block))
+    elif helmet is not None or scan["helmet_delegated"]:
+        status = "already-present"
+    elif scan["root"] is None:
+        return content, "no-match"
+    else:
+        status = "patched"
+        edits.append((scan["root"], scan["root"], "\n" + build_helmet_component(metadata)))
+
+    # Import Helmet if we render it, placing it after the React import
+    if not scan["helmet_import"] and not scan["helmet_delegated"]:
+        anchor = scan["react_import"] if scan["react_import"] is not None else scan["last_import"]
+        if anchor is None:
+            edits.append((0, 0, HELMET_IMPORT + "\n"))
+        else:
+            edits.append((anchor, anchor, "\n" + HELMET_IMPORT))
+
+    if not edits:
+        return content, status
+
+    pieces = []
+    cursor = 0
+    for start, end, text in sorted(edits, key=lambda edit: edit[0]):
+        pieces.append(content[cursor:start])
+        pieces.append(text)
+        cursor = end
+    pieces.append(content[cursor:])
+    return "".join(pieces), status
+
+def inject_tool_seo(content, metadata):
+    """Return tool component source with SEO metadata added, and the outcome status"""
+    return inject_seo(content, metadata)
+
+def inject_game_seo(content, metadata):
+    """Return game component source with SEO metadata added, and the outcome status"""
+    return inject_seo(content, metadata)
+
+def patch_component(file_path, metadata, inject, entry=None):
+    """Apply an injector to a single component and describe the outcome.
+
+    ``entry`` is the component's record from the cache manifest, if any. The
+    returned result dict carries the outcome status and the manifest entry to
+    store for the file, so this can run in a worker process without access to
+    the shared cache.
+    """
+    result = {
+        "path": file_path,
+        "status": None,
+        "error": None,
+        "written": False,
+        "entry": None,
+        "bytes_read": 0,
+        "bytes_written": 0,
+        "scan_seconds": 0.0
+    }
+
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        # Check if Helmet is already imported
-        if "import { Helmet } from 'react-helmet'" not in content and "import { Helmet }" not in content:
-            # Add Helmet import after React import
-            content = re.sub(
-                r"(import React[^\n]*)",
-                r"\1\nimport { Helmet } from 'react-helmet';",
-                content,
-                1
-            )
-        
-        # Create Helmet component with metadata
-        helmet_component = f'''      <Helmet>
-        <title>{metadata['title']}</title>
-        <meta name="description" content="{metadata['description']}" />
-        <meta name="keywords" content="{metadata['keywords']}" />
-        <meta name="author" content="Edurance Hub" />
-      </Helmet>'''
-        
-        # Insert Helmet component at the beginning of the return statement if not already present
-        if "<Helmet>" not in content:
-            content = re.sub(
-                r"(\n\s*return\s*\(\s*\n\s*<div[^>]*>)",
-                f"\\1\n{helmet_component}",
-                content,
-                1
-            )
-        
-        # Write the updated content back to the file
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        print(f"Successfully added SEO metadata to {file_path}")
-        return True
+        metadata_hash = hash_metadata(metadata)
+        if entry is not None and entry["metadata"] != metadata_hash:
+            entry = None
+
+        # Fast path: size and mtime match what we recorded after the last run
+        st = os.stat(file_path)
+        if entry is not None and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            result["status"] = "cached"
+            result["entry"] = entry
+            return result
+
+        with open(file_path, "rb") as f:
+            original = f.read()
+        result["bytes_read"] = len(original)
+
+        # Slow path: the file was touched but its contents are what we produced
+        if entry is not None and entry["source"] == hash_bytes(original):
+            result["status"] = "cached"
+            result["entry"] = dict(entry, mtime=st.st_mtime_ns, size=st.st_size)
+            return result
+
+        start = time.perf_counter()
+        content, status = inject(original.decode("utf-8"), metadata)
+        result["scan_seconds"] = time.perf_counter() - start
+        updated = content.encode("utf-8")
+
+        # Only write when the output bytes actually differ
+        if updated != original:
+            with open(file_path, "wb") as f:
+                f.write(updated)
+            result["written"] = True
+            result["bytes_written"] = len(updated)
+            st = os.stat(file_path)
+
+        result["status"] = status
+        result["entry"] = {
+            "source": hash_bytes(updated),
+            "metadata": metadata_hash,
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size
+        }
     except Exception as e:
-        print(f"Error adding SEO metadata to {file_path}: {str(e)}")
-        return False
+        result["status"] = "error"
+        result["error"] = str(e)
 
-def process_tools():
-    """Process all tool components"""
-    tool_metadata = read_tool_metadata()
-    
-    # Map of tool IDs to file names
-    tool_file_map = {
-        "water-intake": "WaterIntakeCalculator.tsx",
-        "food-calories": "FoodCaloriesCalculator.tsx",
-        "calories-burn": "CaloriesBurnCalculator.tsx",
-        "body-fat": "BodyFatCalculator.tsx",
-        "bmi-calculator": "BMICalculator.tsx",
-        "gst-calculator": "GSTCalculator.tsx",
-        "electricity-bill": "ElectricityBillCalculator.tsx",
-        "simple-interest": "SimpleInterestCalculator.tsx",
-        "compound-interest": "CompoundInterestCalculator.tsx",
-        "percentage-calculator": "PercentageCalculator.tsx",
-        "loan-emi": "LoanEMICalculator.tsx",
-        "currency-converter": "CurrencyConverter.tsx",
-        "salary-satisfaction": "SalarySatisfactionCalculator.tsx",
-        "unit-converter": "UnitConverter.tsx",
-        "percentage-cgpa": "PercentageToCGPA.tsx",
-        "timezone-converter": "TimezoneConverter.tsx",
-        "profession-finder": "ProfessionFinder.tsx",
-        "exam-survival": "ExamSurvivalProbability.tsx",
-        "love-percentage": "LovePercentage.tsx",
-        "friendship-calculator": "FriendshipCalculator.tsx",
-        "breakup-probability": "BreakupProbability.tsx",
-        "cheating-suspicion": "CheatingSuspicion.tsx",
-        "best-friend-loyalty": "BestFriendLoyalty.tsx",
-        "divorce-outcome": "DivorceOutcome.tsx",
-        "gold-digger": "GoldDigger.tsx",
-        "password-strength": "PasswordStrengthChecker.tsx",
-        "character-checker": "CharacterChecker.tsx",
-        "sex-ride-tonight": "SexRideTonight.tsx",
-        "dowry-calculator": "DowryCalculator.tsx",
-        "pet-affection": "PetAffectionCalculator.tsx",
-        "laziness-calculator": "LazinessCalculator.tsx"
-    }
+    return result
+
+def run_patch_task(task):
+    """Unpack a (file_path, metadata, inject, entry) task for executor.map"""
+    return patch_component(*task)
+
+def record_result(result, cache=None, stats=None):
+    """Fold a patch result into the cache and counters and report it"""
+    file_path = result["path"]
+    status = result["status"]
+
+    if stats is not None:
+        stats[status] += 1
+        stats["hits" if status == "cached" else "misses"] += 1
+        if result["written"]:
+            stats["written"] += 1
+
+    if cache is not None and result["entry"] is not None:
+        cache["files"][file_path] = result["entry"]
+
+    # Workers measure themselves; fold their numbers into the parent's stage
+    if instrumentation.is_enabled():
+        instrumentation.add(f"files_{status}")
+        instrumentation.add("bytes_read", result["bytes_read"])
+        instrumentation.add("bytes_written", result["bytes_written"])
+        instrumentation.add("scan_seconds", result["scan_seconds"])
+
+    if status == "patched":
+        print(f"Successfully added SEO metadata to {file_path}")
+    elif status == "already-present":
+        print(f"SEO metadata already present in {file_path}")
+    elif status == "no-match":
+        print(f"No JSX return root found in {file_path}, Helmet block not added")
+    elif status == "error":
+        print(f"Error adding SEO metadata to {file_path}: {result['error']}")
+
+    return status != "error"
+
+def iter_batches(items, size):
+    """Group an iterable into lists of at most ``size`` items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def run_tasks(tasks, cache=None, stats=None, executor=None, jobs=1):
+    """Patch (file_path, metadata, inject) tasks serially or on an executor.
+
+    Tasks may be a lazy iterable; they are consumed in bounded batches and
+    results are reported in task order, so parallel runs produce the same
+    output and file contents as serial ones. Returns the number of tasks run.
+    """
+    files = cache["files"] if cache is not None else {}
+    count = 0
+
+    for batch in iter_batches(tasks, jobs * TASK_BATCH_SIZE):
+        batch = [(path, metadata, inject, files.get(path)) for path, metadata, inject in batch]
+
+        if executor is None:
+            results = map(run_patch_task, batch)
+        else:
+            chunksize = max(1, len(batch) // (jobs * 4))
+            results = executor.map(run_patch_task, batch, chunksize=chunksize)
+
+        for result in results:
+            record_result(result, cache, stats)
+            count += 1
+
+    return count
+
+def add_seo_to_tool_component(file_path, metadata, cache=None, stats=None):
+    """Add SEO metadata to a tool component"""
+    entry = cache["files"].get(file_path) if cache is not None else None
+    return record_result(patch_component(file_path, metadata, inject_tool_seo, entry), cache, stats)
+
+def add_seo_to_game_component(file_path, metadata, cache=None, stats=None):
+    """Add SEO metadata to a game component"""
+    entry = cache["files"].get(file_path) if cache is not None else None
+    return record_result(patch_component(file_path, metadata, inject_game_seo, entry), cache, stats)
+
+def process_tools(cache=None, stats=None, executor=None, jobs=1, index=None, records=None):
+    """Process all tool components, from the given records or the metadata artifacts"""
+    routes = (index or build_component_index())["routes"]
+    if records is None:
+        records = iter_tool_records()
     
-    # Process each category
-    for category, tools in tool_metadata.items():
-        for tool in tools:
+    # Process each tool as its record is read
+    def iter_tasks():
+        for tool in records:
             tool_id = tool["id"]
             metadata = tool["metadata"]
             
-            if tool_id in tool_file_map:
-                file_path = f"src/components/tools/{tool_file_map[tool_id]}"
+            file_path = routes.get(tool_id)
+            if file_path is not None:
                 if os.path.exists(file_path):
-                    add_seo_to_tool_component(file_path, metadata)
+                    yield (file_path, metadata, inject_tool_seo)
                 else:
                     print(f"File not found: {file_path}")
             else:
                 print(f"No file mapping found for tool ID: {tool_id}")
 
-def process_games():
-    """Process all game components"""
-    game_metadata = read_game_metadata()
-    
-    # Map of game IDs to file names
-    game_file_map = {
-        "math-roast": "MathRoastGame.tsx",
-        "typing-speed": "TypingSpeedTest.tsx",
-        "tic-tac-toe": "TicTacToe.tsx",
-        "rock-paper-scissors": "RockPaperScissors.tsx",
-        "snake": "SnakeGame.tsx",
-        "memory-flip": "MemoryFlipGame.tsx",
-        "word-scramble": "WordScramble.tsx",
-        "pong-2d": "Pong2D.tsx",
-        "hangman": "HangmanGame.tsx"
-    }
+    with instrumentation.stage("patch_tools"):
+        return run_tasks(iter_tasks(), cache, stats, executor, jobs)
+
+def process_games(cache=None, stats=None, executor=None, jobs=1, index=None, records=None):
+    """Process all game components, from the given records or the metadata artifacts"""
+    routes = (index or build_component_index())["routes"]
+    if records is None:
+        records = iter_game_records()
     
-    # Process each game
-    for game in game_metadata:
-        game_id = game["id"]
-        metadata = game["metadata"]
-        
-        if game_id in game_file_map:
-            file_path = f"src/components/tools/{game_file_map[game_id]}"
-            if os.path.exists(file_path):
-                add_seo_to_game_component(file_path, metadata)
+    # Process each game as its record is read
+    def iter_tasks():
+        for game in records:
+            game_id = game["id"]
+            metadata = game["metadata"]
+            
+            file_path = routes.get(game_id)
+            if file_path is not None:
+                if os.path.exists(file_path):
+                    yield (file_path, metadata, inject_game_seo)
+                else:
+                    print(f"File not found: {file_path}")
             else:
-                print(f"File not found: {file_path}")
-        else:
-            print(f"No file mapping found for game ID: {game_id}")
+                print(f"No file mapping found for game ID: {game_id}")
+
+    with instrumentation.stage("patch_games"):
+        return run_tasks(iter_tasks(), cache, stats, executor, jobs)
 
 def main():
+    parser = argparse.ArgumentParser(description="Add SEO metadata to tool and game components")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the component cache")
+    parser.add_argument("--cache-file", default=CACHE_FILE, help=f"component cache manifest (default: {CACHE_FILE})")
+    parser.add_argument("--index-file", default=INDEX_FILE, help=f"component index (default: {INDEX_FILE})")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes; 1 runs serially (default: CPU count)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.report:
+        instrumentation.enable()
+
+    with instrumentation.profiled(args.profile):
+        run(args)
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+def run(args):
+    """Patch tool and game components as configured by the parsed arguments"""
+    with instrumentation.stage("load_cache"):
+        cache = None if args.no_cache else load_cache(args.cache_file)
+    stats = new_stats()
+    jobs = max(1, args.jobs)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+
+    # Resolve route IDs to component files once for both tools and games
+    index = build_component_index(args.index_file, persist=not args.no_cache)
+
     print("Adding SEO metadata to tool and game components...")
-    
-    # Process tools
-    print("\nProcessing tools...")
-    process_tools()
-    
-    # Process games
-    print("\nProcessing games...")
-    process_games()
-    
+
+    try:
+        # Process tools
+        print("\nProcessing tools...")
+        process_tools(cache, stats, executor, jobs, index)
+
+        # Process games
+        print("\nProcessing games...")
+        process_games(cache, stats, executor, jobs, index)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if cache is not None:
+        with instrumentation.stage("save_cache"):
+            save_cache(cache, args.cache_file)
+
+    print(f"\nCache: {stats['hits']} hits, {stats['misses']} misses, {stats['written']} files written")
+    print("Results: " + ", ".join(f"{stats[status]} {status}" for status in STATUSES))
     print("\nSEO metadata addition completed!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
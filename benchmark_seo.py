@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the SEO generation and injection pipeline.
+
+Builds synthetic TOOLS/GAMES catalogs and TSX components of configurable size,
+times each pipeline stage in a fresh process (so peak RSS is per stage), writes
+machine-readable results and optionally compares them against a stored
+baseline, exiting non-zero on regressions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+import add_seo_to_components
+import seo_compact
+import seo_duplicates
+import seo_optimization
+
+CATEGORIES = ["health", "finance", "student", "relationship", "entertainment"]
+
+STAGES = ["tool_metadata", "game_metadata", "compact_metadata", "near_duplicates", "sitemap", "patch_components", "patch_components_cached"]
+
+# Stages that write one file per catalog entry; these are slow to set up at
+# the largest sizes, so they are capped unless --max-component-size says otherwise
+COMPONENT_STAGES = {"patch_components", "patch_components_cached"}
+
+RESULTS_FILE = "bench_results.json"
+
+# Synthetic component modelled on the real ones: a render helper whose return
+# must be skipped, filler logic, and a top-level <div> return root
+COMPONENT_TEMPLATE = """import React, {{ useState }} from 'react';
+import {{ Calculator }} from 'lucide-react';
+
+const {name} = () => {{
+  const [value, setValue] = useState('');
+  const [mode, setMode] = useState('basic');
+
+  const renderInputs = () => {{
+    switch (mode) {{
+      case 'basic':
+        return (
+          <div className="space-y-4">
+            <input value={{value}} onChange={{(e) => setValue(e.target.value)}} />
+          </div>
+        );
+      default:
+        return null;
+    }}
+  }};
+{filler}
+  return (
+    <div className={{`max-w-2xl mx-auto ${{value.length > 3 ? 'space-y-8' : ''}}`}}>
+      <div className="text-center">
+        <Calculator size={{48}} className="mx-auto text-blue-500 mb-4" />
+        <h2 className="text-3xl font-bold text-white mb-4">{name}</h2>
+        <p className="text-purple-200">Don't forget to check the result</p>
+      </div>
+      {{renderInputs()}}
+    </div>
+  );
+}};
+
+export default {name};
+"""
+
+FILLER_LINE = "  const step{i} = (x: number) => (x > {i} ? x * {i} : x + {i});\n"
+
+def synthetic_catalog(size):
+    """Return (tools, games) catalogs with ``size`` tools spread over the categories and ``size`` games"""
+    tools = {category: [] for category in CATEGORIES}
+    for i in range(size):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        tools[category].append({
+            "id": f"synthetic-tool-{i}",
+            "name": f"Synthetic Tool {i} Calculator",
+            "description": f"Calculate synthetic value number {i} for benchmarking the pipeline"
+        })
+
+    games = [
+        {
+            "id": f"synthetic-game-{i}",
+            "name": f"Synthetic Game {i}",
+            "description": f"Play synthetic benchmark game number {i} with modern controls"
+        }
+        for i in range(size)
+    ]
+    return tools, games
+
+def use_catalog(size):
+    """Point seo_optimization at a synthetic catalog of the given size"""
+    seo_optimization.TOOLS, seo_optimization.GAMES = synthetic_catalog(size)
+
+def write_components(size, directory, filler_lines):
+    """Write ``size`` synthetic components and return their patch tasks"""
+    os.makedirs(directory, exist_ok=True)
+    filler = "".join(FILLER_LINE.format(i=i) for i in range(filler_lines))
+    tasks = []
+    for record in seo_optimization.iter_tool_metadata():
+        name = "".join(part.capitalize() for part in record["id"].split("-"))
+        path = os.path.join(directory, f"{name}.tsx")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(COMPONENT_TEMPLATE.format(name=name, filler=filler))
+        tasks.append((path, record["metadata"], add_seo_to_components.inject_tool_seo))
+    return tasks
+
+def run_stage(stage, size, workdir, filler_lines):
+    """Set up and time one stage in the current process.
+
+    Returns elapsed seconds for the timed section and the process's peak RSS
+    in kilobytes.
+    """
+    use_catalog(size)
+
+    if stage == "tool_metadata":
+        start = time.perf_counter()
+        seo_optimization.generate_tool_metadata()
+        elapsed = time.perf_counter() - start
+
+    elif stage == "game_metadata":
+        start = time.perf_counter()
+        seo_optimization.generate_game_metadata()
+        elapsed = time.perf_counter() - start
+
+    elif stage == "compact_metadata":
+        start = time.perf_counter()
+        seo_compact.generate_compact_metadata()
+        elapsed = time.perf_counter() - start
+
+    elif stage == "near_duplicates":
+        start = time.perf_counter()
+        seo_duplicates.find_duplicates()
+        elapsed = time.perf_counter() - start
+
+    elif stage == "sitemap":
+        start = time.perf_counter()
+        seo_optimization.write_sitemap(seo_optimization.generate_sitemap_entries("2025-01-01"), workdir)
+        elapsed = time.perf_counter() - start
+
+    elif stage == "patch_components":
+        tasks = write_components(size, os.path.join(workdir, "components"), filler_lines)
+        start = time.perf_counter()
+        for task in tasks:
+            add_seo_to_components.patch_component(*task)
+        elapsed = time.perf_counter() - start
+
+    elif stage == "patch_components_cached":
+        tasks = write_components(size, os.path.join(workdir, "components"), filler_lines)
+        cache = {"version": add_seo_to_components.CACHE_VERSION, "files": {}}
+        for path, metadata, inject in tasks:
+            result = add_seo_to_components.patch_component(path, metadata, inject)
+            cache["files"][path] = result["entry"]
+        start = time.perf_counter()
+        for path, metadata, inject in tasks:
+            add_seo_to_components.patch_component(path, metadata, inject, cache["files"][path])
+        elapsed = time.perf_counter() - start
+
+    else:
+        raise ValueError(f"Unknown stage: {stage}")
+
+    # ru_maxrss is kilobytes on Linux but bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return elapsed, peak_rss
+
+def measure(stage, size, filler_lines):
+    """Run a stage in a fresh worker process with its own scratch directory"""
+    workdir = tempfile.mkdtemp(prefix=f"seo-bench-{stage}-")
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            return executor.submit(run_stage, stage, size, workdir, filler_lines).result()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def run_benchmarks(stages, sizes, repeat=3, filler_lines=40, max_component_size=10000):
+    """Measure every stage at every size, keeping the fastest of ``repeat`` runs"""
+    results = []
+    for size in sizes:
+        for stage in stages:
+            if stage in COMPONENT_STAGES and size > max_component_size:
+                print(f"  {stage:<26} {size:>8}  skipped (above --max-component-size)")
+                continue
+
+            timings = [measure(stage, size, filler_lines) for _ in range(repeat)]
+            seconds = min(elapsed for elapsed, _ in timings)
+            peak_rss = max(rss for _, rss in timings)
+            results.append({"stage": stage, "size": size, "seconds": seconds, "peak_rss_kb": peak_rss})
+            print(f"  {stage:<26} {size:>8}  {seconds * 1000:10.2f} ms  {peak_rss / 1024:8.1f} MB")
+    return results
+
+def compare_results(results, baseline, tolerance=0.25, min_delta=0.005):
+    """Return results slower than the baseline by more than ``tolerance``.
+
+    ``min_delta`` seconds of slack keeps sub-millisecond stages from failing on
+    timer noise.
+    """
+    expected = {(item["stage"], item["size"]): item for item in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        reference = expected.get((result["stage"], result["size"]))
+        if reference is None:
+            continue
+        limit = max(reference["seconds"] * (1 + tolerance), reference["seconds"] + min_delta)
+        if result["seconds"] > limit:
+            regressions.append({
+                "stage": result["stage"],
+                "size": result["size"],
+                "seconds": result["seconds"],
+                "baseline_seconds": reference["seconds"]
+            })
+    return regressions
+
+def write_results(results, path):
+    """Write results with enough environment detail to judge comparability"""
+    payload = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+def parse_list(value, cast=str):
+    """Parse a comma-separated command line list"""
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SEO generation and injection pipeline")
+    parser.add_argument("--sizes", default="10,100,1000", help="comma-separated catalog sizes (default: 10,100,1000)")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"comma-separated stages (default: all of {', '.join(STAGES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the fastest is kept (default: 3)")
+    parser.add_argument("--component-lines", type=int, default=40, help="filler lines per synthetic component (default: 40)")
+    parser.add_argument("--max-component-size", type=int, default=10000,
+                        help="largest size at which component stages run (default: 10000)")
+    parser.add_argument("--output", default=RESULTS_FILE, help=f"results file (default: {RESULTS_FILE})")
+    parser.add_argument("--baseline", help="baseline results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (default: 0.25)")
+    parser.add_argument("--save-baseline", help="also write the results to this baseline file")
+    args = parser.parse_args()
+
+    stages = parse_list(args.stages)
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)}")
+
+    print("Edurance Hub SEO Pipeline Benchmarks")
+    print("====================================")
+    results = run_benchmarks(stages, parse_list(args.sizes, int), max(1, args.repeat),
+                             args.component_lines, args.max_component_size)
+
+    write_results(results, args.output)
+    print(f"\nResults written to {args.output}")
+    if args.save_baseline:
+        write_results(results, args.save_baseline)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for item in regressions:
+                print(f"  {item['stage']} @ {item['size']}: {item['seconds'] * 1000:.2f} ms "
+                      f"(baseline {item['baseline_seconds'] * 1000:.2f} ms)")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Component index for Edurance Hub tools and games.
+
+Scans src/components/tools, the route switches in ToolDetail/GameDetail and
+the lazy loaders in the generated route manifest to map route IDs (e.g.
+"loan-emi") to component files, caching what each file
+declares by mtime and size so later runs only re-read changed files.
+"""
+
+import argparse
+import json
+import os
+import re
+
+import seo_instrumentation as instrumentation
+
+COMPONENT_DIR = "src/components/tools"
+
+# Files that map route IDs to tool/game components, either with switch
+# statements or with the lazy loaders of the generated route manifest
+ROUTER_FILES = ["src/components/ToolDetail.tsx", "src/components/GameDetail.tsx", "src/generated/routeManifest.ts"]
+
+INDEX_FILE = ".seo_component_index.json"
+
+# Bump when extraction rules change so cached entries are re-scanned
+INDEX_VERSION = 2
+
+DEFAULT_EXPORT = re.compile(r"^export\s+default\s+(?:function\s+|class\s+)?([A-Za-z_$][\w$]*)", re.M)
+DEFAULT_IMPORT = re.compile(r"""^import\s+([A-Za-z_$][\w$]*)\s+from\s+['"](\.[^'"]+)['"]""", re.M)
+ROUTE_CASE = re.compile(r"""case\s+['"]([\w-]+)['"]\s*:\s*return\s*<([A-Za-z_$][\w$]*)""")
+ROUTE_LOADER = re.compile(r"""^\s*['"]([\w-]+)['"]\s*:\s*\(\)\s*=>\s*import\(\s*['"](\.[^'"]+)['"]\s*\)""", re.M)
+ROUTE_URL = re.compile(r"""/(?:tools|games)/(?:[a-z0-9-]+/)?([a-z0-9-]+)['"`]""")
+
+def resolve_import(base_dir, spec):
+    """Resolve a relative import specifier to a component file path"""
+    target = os.path.normpath(os.path.join(base_dir, spec)).replace(os.sep, "/")
+    if not os.path.splitext(target)[1]:
+        target += ".tsx"
+    return target
+
+def scan_file(path):
+    """Extract the default export, imports, route cases, lazy loaders and
+    declared route IDs from a file"""
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    base_dir = os.path.dirname(path)
+    imports = {name: resolve_import(base_dir, spec) for name, spec in DEFAULT_IMPORT.findall(content)}
+    loaders = {route_id: resolve_import(base_dir, spec) for route_id, spec in ROUTE_LOADER.findall(content)}
+
+    export = DEFAULT_EXPORT.search(content)
+    return {
+        "component": export.group(1) if export else None,
+        "imports": imports,
+        "cases": dict(ROUTE_CASE.findall(content)),
+        "loaders": loaders,
+        "routes": sorted(set(ROUTE_URL.findall(content)))
+    }
+
+def load_index(path=INDEX_FILE):
+    """Load the persisted index, starting fresh if it is missing or stale"""
+    try:
+        with open(path, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = None
+
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        index = {"version": INDEX_VERSION, "files": {}}
+    return index
+
+def save_index(index, path=INDEX_FILE):
+    """Persist the index atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def list_component_files(component_dir=COMPONENT_DIR, router_files=ROUTER_FILES):
+    """List the files the index covers, in a stable order"""
+    paths = []
+    if os.path.isdir(component_dir):
+        for name in sorted(os.listdir(component_dir)):
+            if name.endswith(".tsx"):
+                paths.append(f"{component_dir}/{name}")
+    paths.extend(path for path in router_files if os.path.exists(path))
+    return paths
+
+def refresh_index(index, paths, stats=None):
+    """Re-scan files whose size or mtime changed and drop entries for removed files"""
+    files = index["files"]
+    seen = set()
+
+    for path in paths:
+        seen.add(path)
+        st = os.stat(path)
+        entry = files.get(path)
+        if entry is not None and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            if stats is not None:
+                stats["hits"] += 1
+            continue
+
+        entry = scan_file(path)
+        entry["mtime"] = st.st_mtime_ns
+        entry["size"] = st.st_size
+        files[path] = entry
+        if stats is not None:
+            stats["misses"] += 1
+
+    for path in list(files):
+        if path not in seen:
+            del files[path]
+
+    return index
+
+def resolve_routes(index):
+    """Build route ID -> component file and component name -> file lookups.
+
+    Route switches and lazy loaders in the router files take precedence; IDs
+    that components declare themselves (e.g. in an SEO url) fill in anything
+    not routed.
+    """
+    files = index["files"]
+    components = {}
+    for path, entry in files.items():
+        if entry["component"] and entry["component"] not in components:
+            components[entry["component"]] = path
+
+    routes = {}
+    for path, entry in files.items():
+        for route_id, name in entry["cases"].items():
+            target = entry["imports"].get(name) or components.get(name)
+            if target in files and route_id not in routes:
+                routes[route_id] = target
+        for route_id, target in entry["loaders"].items():
+            if target in files and route_id not in routes:
+                routes[route_id] = target
+
+    for path, entry in files.items():
+        if entry["cases"] or entry["loaders"]:
+            continue
+        for route_id in entry["routes"]:
+            routes.setdefault(route_id, path)
+
+    return {"routes": routes, "components": components}
+
+def build_component_index(index_path=INDEX_FILE, component_dir=COMPONENT_DIR, router_files=ROUTER_FILES,
+                          stats=None, persist=True):
+    """Load, refresh and (optionally) save the index, returning the resolved lookups"""
+    with instrumentation.stage("component_index"):
+        if stats is None:
+            stats = {"hits": 0, "misses": 0}
+        index = load_index(index_path) if persist else {"version": INDEX_VERSION, "files": {}}
+        refresh_index(index, list_component_files(component_dir, router_files), stats)
+        if persist:
+            save_index(index, index_path)
+        instrumentation.add("files_cached", stats["hits"])
+        instrumentation.add("files_scanned", stats["misses"])
+        return resolve_routes(index)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the tool/game component index")
+    parser.add_argument("--index-file", default=INDEX_FILE, help=f"persisted index (default: {INDEX_FILE})")
+    args = parser.parse_args()
+
+    stats = {"hits": 0, "misses": 0}
+    resolved = build_component_index(args.index_file, stats=stats)
+
+    for route_id, path in sorted(resolved["routes"].items()):
+        print(f"{route_id}: {path}")
+    print(f"\n{len(resolved['routes'])} routes, {len(resolved['components'])} components "
+          f"({stats['hits']} cached, {stats['misses']} scanned)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Generate the route manifest module for lazily loaded tool and game pages.
+
+Writes src/generated/routeManifest.ts, which registers every tool and game in
+the catalog with its SEO metadata and a React.lazy component, so ToolDetail
+and GameDetail load only the chunk for the page being viewed instead of
+bundling every tool up front. Route IDs are resolved to component files with
+the component index (the manifest itself is one of its router files), falling
+back to a component named after the entry, e.g. "Snake Game" -> SnakeGame;
+catalog entries without a component are reported and left out. The module is
+only rewritten when its content changes, and should be committed alongside
+the components since ToolDetail and GameDetail import it.
+"""
+
+import argparse
+import json
+import os
+import re
+
+import component_index
+import seo_instrumentation as instrumentation
+import seo_optimization
+
+MANIFEST_FILE = "src/generated/routeManifest.ts"
+
+MANIFEST_HEADER = """// Generated by route_manifest.py from the SEO catalog. Do not edit by hand;
+// run `python route_manifest.py` (or the SEO pipeline) after changing tools or games.
+import { lazy, type ComponentType, type LazyExoticComponent } from 'react';
+
+export interface RouteEntry {
+  id: string;
+  name: string;
+  category?: string;
+  title: string;
+  description: string;
+  keywords: string;
+  url: string;
+  component: LazyExoticComponent<ComponentType>;
+}
+
+"""
+
+def import_path(manifest_path, component_path):
+    """Return the extensionless relative import specifier for a component"""
+    spec = os.path.relpath(os.path.splitext(component_path)[0], os.path.dirname(manifest_path))
+    spec = spec.replace(os.sep, "/")
+    return spec if spec.startswith(".") else f"./{spec}"
+
+def render_loaders(name, entries, manifest_path):
+    """Render a map of route ID -> dynamic import, one per line"""
+    lines = [f"const {name} = {{"]
+    for record, component_path in entries:
+        lines.append(f"  '{record['id']}': () => import('{import_path(manifest_path, component_path)}'),")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+def render_routes(name, loaders, entries):
+    """Render the exported route ID -> RouteEntry map"""
+    lines = [f"export const {name}: Record<string, RouteEntry> = {{"]
+    for record, _ in entries:
+        metadata = record["metadata"]
+        fields = [("id", record["id"]), ("name", record["name"])]
+        if "category" in record:
+            fields.append(("category", record["category"]))
+        fields.extend((key, metadata[key]) for key in ("title", "description", "keywords", "url"))
+
+        lines.append(f"  '{record['id']}': {{")
+        for key, value in fields:
+            lines.append(f"    {key}: {json.dumps(value, ensure_ascii=False)},")
+        lines.append(f"    component: lazy({loaders}['{record['id']}'])")
+        lines.append("  },")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+def render_manifest(tools, games, manifest_path=MANIFEST_FILE):
+    """Render the manifest module from (record, component_path) pairs"""
+    return "\n".join([
+        MANIFEST_HEADER + render_loaders("toolLoaders", tools, manifest_path),
+        render_loaders("gameLoaders", games, manifest_path),
+        render_routes("toolRoutes", "toolLoaders", tools),
+        render_routes("gameRoutes", "gameLoaders", games)
+    ])
+
+def component_name(name):
+    """Return the conventional component name for a catalog entry name"""
+    return "".join(word[:1].upper() + word[1:] for word in re.findall(r"[A-Za-z0-9]+", name))
+
+def resolve_entries(records, index, missing):
+    """Pair records with their component files, collecting IDs without one"""
+    entries = []
+    for record in records:
+        path = index["routes"].get(record["id"]) or index["components"].get(component_name(record["name"]))
+        if path is None:
+            missing.append(record["id"])
+        else:
+            entries.append((record, path))
+    return entries
+
+def write_route_manifest(path=MANIFEST_FILE, index=None, tool_records=None, game_records=None, stats=None):
+    """Regenerate the manifest, returning True if the file changed"""
+    with instrumentation.stage("route_manifest"):
+        if stats is None:
+            stats = {}
+        if index is None:
+            index = component_index.build_component_index()
+        if tool_records is None:
+            tool_records = seo_optimization.iter_tool_metadata()
+        if game_records is None:
+            game_records = seo_optimization.iter_game_metadata()
+
+        missing = []
+        tools = resolve_entries(tool_records, index, missing)
+        games = resolve_entries(game_records, index, missing)
+        stats["routes"] = len(tools) + len(games)
+        stats["missing"] = missing
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8", newline="\n") as f:
+            f.write(render_manifest(tools, games, path))
+        changed = seo_optimization.replace_if_changed(f"{path}.tmp", path)
+        instrumentation.add("routes", stats["routes"])
+        return changed
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the lazy route manifest for tool and game pages")
+    parser.add_argument("--output", default=MANIFEST_FILE, help=f"manifest module (default: {MANIFEST_FILE})")
+    parser.add_argument("--index-file", default=component_index.INDEX_FILE,
+                        help=f"component index (default: {component_index.INDEX_FILE})")
+    args = parser.parse_args()
+
+    stats = {}
+    changed = write_route_manifest(args.output, component_index.build_component_index(args.index_file), stats=stats)
+    for route_id in stats["missing"]:
+        print(f"No component found for {route_id}; left out of the manifest")
+    print(f"{'Wrote' if changed else 'Unchanged'} {args.output} ({stats['routes']} routes)")
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,23 @@
  * Automatically generates and updates sitemap.xml with all tools and games
  */
 
-import { writeFileSync } from 'fs';
+import { existsSync, readFileSync, writeFileSync } from 'fs';
 import { join } from 'path';
 
 // Current date for lastmod
 const currentDate = new Date().toISOString().split('T')[0];
 
+// Content-derived lastmod dates maintained by seo_lastmod.py; URLs it does
+// not know about fall back to the current date
+const lastmodManifestPath = join(process.cwd(), '.seo_lastmod.json');
+const lastmodManifest = existsSync(lastmodManifestPath)
+  ? JSON.parse(readFileSync(lastmodManifestPath, 'utf8')).urls || {}
+  : {};
+
+function lastmodFor(loc) {
+  return lastmodManifest[loc] ? lastmodManifest[loc].lastmod : currentDate;
+}
+
 // Tool data - in a real implementation, this would be imported from your data source
 const TOOLS = {
   health: [
@@ -76,7 +87,7 @@ function generateSitemap() {
   <!-- Homepage -->
   <url>
     <loc>https://edurancehub.com/</loc>
-    <lastmod>${currentDate}</lastmod>
+    <lastmod>${lastmodFor('https://edurancehub.com/')}</lastmod>
     <changefreq>weekly</changefreq>
     <priority>1.0</priority>
   </url>
@@ -84,25 +95,25 @@ function generateSitemap() {
   <!-- Main Pages -->
   <url>
     <loc>https://edurancehub.com/tools</loc>
-    <lastmod>${currentDate}</lastmod>
+    <lastmod>${lastmodFor('https://edurancehub.com/tools')}</lastmod>
     <changefreq>weekly</changefreq>
     <priority>0.9</priority>
   </url>
   <url>
     <loc>https://edurancehub.com/games</loc>
-    <lastmod>${currentDate}</lastmod>
+    <lastmod>${lastmodFor('https://edurancehub.com/games')}</lastmod>
     <changefreq>weekly</changefreq>
     <priority>0.9</priority>
   </url>
   <url>
     <loc>https://edurancehub.com/about</loc>
-    <lastmod>${currentDate}</lastmod>
+    <lastmod>${lastmodFor('https://edurancehub.com/about')}</lastmod>
     <changefreq>monthly</changefreq>
     <priority>0.8</priority>
   </url>
   <url>
     <loc>https://edurancehub.com/contact</loc>
-    <lastmod>${currentDate}</lastmod>
+    <lastmod>${lastmodFor('https://edurancehub.com/contact')}</lastmod>
     <changefreq>monthly</changefreq>
     <priority>0.8</priority>
   </url>
@@ -114,7 +125,7 @@ function generateSitemap() {
   TOOLS.health.forEach(tool => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/tools/health/${tool.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/tools/health/${tool.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -126,7 +137,7 @@ function generateSitemap() {
   TOOLS.finance.forEach(tool => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/tools/finance/${tool.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/tools/finance/${tool.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -138,7 +149,7 @@ function generateSitemap() {
   TOOLS.student.forEach(tool => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/tools/student/${tool.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/tools/student/${tool.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -150,7 +161,7 @@ function generateSitemap() {
   TOOLS.relationship.forEach(tool => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/tools/relationship/${tool.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/tools/relationship/${tool.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -162,7 +173,7 @@ function generateSitemap() {
   TOOLS.entertainment.forEach(tool => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/tools/entertainment/${tool.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/tools/entertainment/${tool.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -174,7 +185,7 @@ function generateSitemap() {
   GAMES.forEach(game => {
     xml += `  <url>\n`;
     xml += `    <loc>https://edurancehub.com/games/${game.id}</loc>\n`;
-    xml += `    <lastmod>${currentDate}</lastmod>\n`;
+    xml += `    <lastmod>${lastmodFor(`https://edurancehub.com/games/${game.id}`)}</lastmod>\n`;
     xml += `    <changefreq>monthly</changefreq>\n`;
     xml += `    <priority>0.8</priority>\n`;
     xml += `  </url>\n`;
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Compact metadata records for large Edurance Hub catalogs.
+
+Full metadata records repeat the same title/description templates and shared
+keywords ("edurance hub", "free calculator", the per-category triples) in
+every entry. A CompactRecord instead keeps only the catalog fields plus the ID
+of a keyword sequence in a shared KeywordDictionary. Keywords derived from the
+entry's name ("free <name>", "<name> calculator") are interned as templates,
+so every tool in a category shares one sequence. Titles, descriptions,
+keywords and URLs are rendered on demand with the same templates as
+seo_optimization.build_tool_record/build_game_record, so the rendered output
+is identical.
+
+The optional on-disk format (metadata.compact.json) stores the dictionary once
+and each record as a short array:
+
+    {"version": 1,
+     "keywords": ["\u0000", "free \u0000", ..., "edurance hub", ...],
+     "sequences": [[0, 1, 2, ...], ...],
+     "tools": [[id, name, description, category_keyword_id, sequence_id], ...],
+     "games": [[id, name, description, sequence_id], ...]}
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+
+COMPACT_METADATA_FILE = "metadata.compact.json"
+
+COMPACT_VERSION = 1
+
+# Stands in for the lowercased entry name inside keyword templates
+NAME_SLOT = "\0"
+
+class KeywordDictionary:
+    """Interns keyword strings and whole keyword sequences to small integer IDs"""
+
+    __slots__ = ("strings", "ids", "sequences", "sequence_ids")
+
+    def __init__(self, strings=(), sequences=()):
+        self.strings = []
+        self.ids = {}
+        self.sequences = []
+        self.sequence_ids = {}
+        for value in strings:
+            self.intern(value)
+        for ids in sequences:
+            self.intern_sequence(ids)
+
+    def __len__(self):
+        return len(self.strings)
+
+    def intern(self, value):
+        """Return the ID for a string, adding it if it is new"""
+        key = self.ids.get(value)
+        if key is None:
+            key = len(self.strings)
+            value = sys.intern(value)
+            self.strings.append(value)
+            self.ids[value] = key
+        return key
+
+    def intern_sequence(self, ids):
+        """Return the ID for a sequence of keyword IDs, adding it if it is new"""
+        ids = tuple(ids)
+        key = self.sequence_ids.get(ids)
+        if key is None:
+            key = len(self.sequences)
+            self.sequences.append(array("I", ids))
+            self.sequence_ids[ids] = key
+        return key
+
+    def encode(self, values):
+        """Intern a list of keyword templates and return its sequence ID"""
+        return self.intern_sequence(map(self.intern, values))
+
+    def decode(self, sequence, name):
+        """Expand a sequence ID into keywords for the entry called ``name``"""
+        strings = self.strings
+        name = name.lower()
+        return [strings[key].replace(NAME_SLOT, name) for key in self.sequences[sequence]]
+
+class CompactRecord:
+    """A tool or game reduced to its catalog fields and keyword sequence ID.
+
+    ``category`` is None for games.
+    """
+
+    __slots__ = ("id", "name", "description", "category", "keywords")
+
+    def __init__(self, id, name, description, category, keywords):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.category = category
+        self.keywords = keywords
+
+    def entry(self):
+        """Return the catalog entry the templates render from"""
+        return {"id": self.id, "name": self.name, "description": self.description}
+
+    def render(self, dictionary):
+        """Expand into the full record seo_optimization would have built"""
+        entry = self.entry()
+        keywords = ", ".join(dictionary.decode(self.keywords, self.name))
+
+        if self.category is None:
+            return {
+                "id": self.id,
+                "name": self.name,
+                "metadata": {
+                    "title": seo_optimization.game_title(entry),
+                    "description": seo_optimization.game_description(entry),
+                    "keywords": keywords,
+                    "url": f"{seo_optimization.SITE_URL}/games/{self.id}"
+                }
+            }
+
+        return {
+            "id": self.id,
+            "name": self.name,
+            "category": self.category,
+            "metadata": {
+                "title": seo_optimization.tool_title(entry),
+                "description": seo_optimization.tool_description(self.category, entry),
+                "keywords": keywords,
+                "url": f"{seo_optimization.SITE_URL}/tools/{self.category}/{self.id}"
+            }
+        }
+
+def iter_compact_tool_records(dictionary):
+    """Yield a CompactRecord for each tool, interning keywords into ``dictionary``"""
+    for category, tools in seo_optimization.TOOLS.items():
+        category = sys.intern(category)
+        # Tool keywords depend only on the name and category
+        sequence = dictionary.encode(seo_optimization.tool_keywords(category, {"name": NAME_SLOT}))
+        for tool in tools:
+            yield CompactRecord(tool["id"], tool["name"], tool["description"], category, sequence)
+
+def iter_compact_game_records(dictionary):
+    """Yield a CompactRecord for each game, interning keywords into ``dictionary``"""
+    for game in seo_optimization.GAMES:
+        template = {"name": NAME_SLOT, "description": game["description"]}
+        yield CompactRecord(game["id"], game["name"], game["description"], None,
+                            dictionary.encode(seo_optimization.game_keywords(template)))
+
+def generate_compact_metadata():
+    """Return (dictionary, tool_records, game_records) for the whole catalog"""
+    dictionary = KeywordDictionary()
+    with instrumentation.stage("generate_compact_metadata"):
+        tool_records = list(iter_compact_tool_records(dictionary))
+        game_records = list(iter_compact_game_records(dictionary))
+        instrumentation.add("records", len(tool_records) + len(game_records))
+        instrumentation.add("keywords", len(dictionary))
+        instrumentation.add("sequences", len(dictionary.sequences))
+    return dictionary, tool_records, game_records
+
+def render_records(records, dictionary):
+    """Lazily expand compact records into full metadata records"""
+    for record in records:
+        yield record.render(dictionary)
+
+def write_compact_metadata(dictionary, tool_records, game_records, path=COMPACT_METADATA_FILE):
+    """Write the compact artifact, replacing ``path`` only if its content changed"""
+    tools = [[record.id, record.name, record.description, dictionary.intern(record.category), record.keywords]
+             for record in tool_records]
+    games = [[record.id, record.name, record.description, record.keywords] for record in game_records]
+    payload = {
+        "version": COMPACT_VERSION,
+        "keywords": dictionary.strings,
+        "sequences": [ids.tolist() for ids in dictionary.sequences],
+        "tools": tools,
+        "games": games
+    }
+    with instrumentation.stage("save_compact_metadata"):
+        with instrumentation.timer("json_seconds"):
+            text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        changed = seo_optimization.replace_if_changed(f"{path}.tmp", path)
+        if changed:
+            instrumentation.add("bytes_written", len(text))
+    if path == COMPACT_METADATA_FILE:
+        seo_optimization.record_metadata_artifact("compact")
+    return changed
+
+def read_compact_metadata(path=COMPACT_METADATA_FILE):
+    """Read a compact artifact back into (dictionary, tool_records, game_records)"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    instrumentation.add("bytes_read", len(text))
+    with instrumentation.timer("json_seconds"):
+        payload = json.loads(text)
+    if payload.get("version") != COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact metadata version in {path}: {payload.get('version')}")
+
+    dictionary = KeywordDictionary(payload["keywords"], payload["sequences"])
+    strings = dictionary.strings
+    tool_records = [CompactRecord(id, name, description, strings[category], sequence)
+                    for id, name, description, category, sequence in payload["tools"]]
+    game_records = [CompactRecord(id, name, description, None, sequence)
+                    for id, name, description, sequence in payload["games"]]
+    return dictionary, tool_records, game_records
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the compact keyword-dictionary metadata artifact")
+    parser.add_argument("--output", default=COMPACT_METADATA_FILE, help=f"artifact path (default: {COMPACT_METADATA_FILE})")
+    args = parser.parse_args()
+
+    dictionary, tool_records, game_records = generate_compact_metadata()
+    changed = write_compact_metadata(dictionary, tool_records, game_records, args.output)
+
+    state = "Wrote" if changed else "Unchanged"
+    print(f"{state} {args.output}: {len(tool_records)} tools, {len(game_records)} games, "
+          f"{len(dictionary)} distinct keywords, {os.path.getsize(args.output)} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Flag near-duplicate titles, descriptions and keyword sets in the SEO catalog.
+
+Templated metadata makes programmatic pages look alike, and comparing every
+pair of pages is quadratic. Instead each field is shingled (word bigrams for
+titles, trigrams for descriptions, the keyword phrases themselves for
+keywords) and summarised by a MinHash signature, and signatures are split into
+bands so that only pages sharing a band are compared (locality-sensitive
+hashing). Candidates are then checked with the exact Jaccard similarity of
+their shingle hash sets, which is what the report shows.
+
+Signatures use one-permutation hashing: every shingle is hashed once and its
+hash falls into one of SIGNATURE_SIZE bins, each keeping its minimum, so two
+signatures agree on a bin with probability close to the Jaccard similarity.
+Bins a short field leaves empty are filled from a second bin assignment.
+
+Pages at or above the threshold are grouped into clusters, and the report
+(seo_duplicates.json) ranks clusters by size and pairs by similarity.
+Buckets with more than MAX_BUCKET_PAIRS members are only compared against
+their first member, which keeps templated catalogs, where most pages share
+buckets, linear as well.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import re
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import rshift
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+
+DUPLICATES_FILE = "seo_duplicates.json"
+
+REPORT_VERSION = 1
+
+FIELDS = ("title", "description", "keywords")
+
+# Words per shingle for the free-text fields
+SHINGLE_WORDS = {"title": 2, "description": 3}
+
+SIGNATURE_SIZE = 32
+BANDS = 8
+ROWS = SIGNATURE_SIZE // BANDS
+
+# Bins still empty after both assignments; CRC32 values are at most this, so
+# a genuine minimum can only collide with it by chance
+EMPTY_BIN = 0xFFFFFFFF
+
+THRESHOLD = 0.8
+
+MAX_BUCKET_PAIRS = 32
+
+# Clusters, pairs and pages listed per field
+REPORT_LIMIT = 100
+
+WORD = re.compile(r"[a-z0-9]+")
+
+BIN_MASK = SIGNATURE_SIZE - 1
+BIN_SHIFT = BIN_MASK.bit_length()
+BINS = range(SIGNATURE_SIZE)
+
+def shingles(field, value):
+    """Return the shingle set for one field value"""
+    if field == "keywords":
+        return {keyword.strip() for keyword in value.lower().split(",")} - {""}
+    words = WORD.findall(value.lower())
+    size = SHINGLE_WORDS[field]
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return set(map(" ".join, zip(*(words[i:] for i in range(size)))))
+
+def sketch(items):
+    """Return (signature, hashes) for a shingle set as bytes, or None if it is empty.
+
+    ``hashes`` holds the distinct shingle hashes for the exact check.
+    """
+    if not items:
+        return None
+    # Descending, so dict() keeps the smallest hash seen for each bin
+    hashes = sorted(set(map(zlib.crc32, map(str.encode, items))), reverse=True)
+    bins = dict(zip(map(BIN_MASK.__and__, hashes), hashes))
+    if len(bins) == SIGNATURE_SIZE:
+        signature = array("I", map(bins.get, BINS))
+    else:
+        fallback = dict(zip(map(BIN_MASK.__and__, map(rshift, hashes, repeat(BIN_SHIFT))), hashes))
+        signature = array("I", map(bins.get, BINS, map(fallback.get, BINS, repeat(EMPTY_BIN))))
+    return signature.tobytes(), array("I", hashes).tobytes()
+
+def record_sketches(values):
+    """Return one sketch per field for a {field: value} entry"""
+    return tuple(sketch(shingles(field, values[field])) for field in FIELDS)
+
+def jaccard(a, b):
+    """Exact Jaccard similarity of two shingle hash arrays"""
+    a = memoryview(a).cast("I")
+    b = memoryview(b).cast("I")
+    common = len(set(a).intersection(b))
+    return common / (len(a) + len(b) - common)
+
+def iter_entries(tool_records, game_records):
+    """Yield (page, {field: value}) for every catalog record"""
+    prefix = len(seo_optimization.SITE_URL)
+    for records in (tool_records, game_records):
+        for record in records:
+            metadata = record["metadata"]
+            yield metadata["url"][prefix:], {field: metadata[field] for field in FIELDS}
+
+def candidate_pairs(sketches):
+    """Yield (i, j) index pairs whose signatures share at least one band"""
+    width = ROWS * 4
+    for start in range(0, SIGNATURE_SIZE * 4, width):
+        buckets = {}
+        for number, item in enumerate(sketches):
+            if item is not None:
+                buckets.setdefault(item[0][start:start + width], []).append(number)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) <= MAX_BUCKET_PAIRS:
+                for position, i in enumerate(members):
+                    for j in members[position + 1:]:
+                        yield i, j
+            else:
+                pivot = members[0]
+                for j in members[1:]:
+                    yield pivot, j
+
+def find(parents, i):
+    """Union-find root lookup with path halving"""
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+def near_duplicates(pages, sketches, threshold=THRESHOLD, limit=REPORT_LIMIT):
+    """Return the report section for one field's sketches"""
+    parents = list(range(len(pages)))
+    seen = set()
+    top = []
+    pairs = 0
+    for pair in candidate_pairs(sketches):
+        if pair in seen:
+            continue
+        seen.add(pair)
+        i, j = pair
+        score = jaccard(sketches[i][1], sketches[j][1])
+        if score < threshold:
+            continue
+        pairs += 1
+        item = (score, -i, -j)
+        if len(top) < limit:
+            heapq.heappush(top, item)
+        elif item > top[0]:
+            heapq.heapreplace(top, item)
+        root_i, root_j = find(parents, i), find(parents, j)
+        if root_i != root_j:
+            parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    groups = {}
+    for i in range(len(pages)):
+        groups.setdefault(find(parents, i), []).append(i)
+    clusters = sorted((members for members in groups.values() if len(members) > 1),
+                      key=lambda members: (-len(members), members[0]))
+    instrumentation.add("candidates", len(seen))
+
+    return {
+        "pairs": pairs,
+        "clusters": len(clusters),
+        "duplicated": sum(len(members) for members in clusters),
+        "top_clusters": [
+            {"size": len(members), "pages": [pages[i] for i in members[:limit]]}
+            for members in clusters[:limit]
+        ],
+        "top_pairs": [
+            {"similarity": round(score, 4), "pages": [pages[-i], pages[-j]]}
+            for score, i, j in sorted(top, reverse=True)
+        ]
+    }
+
+def find_duplicates(tool_records=None, game_records=None, threshold=THRESHOLD, jobs=1, limit=REPORT_LIMIT):
+    """Build the near-duplicate report for the catalog"""
+    with instrumentation.stage("near_duplicates"):
+        if tool_records is None:
+            tool_records = seo_optimization.iter_tool_metadata()
+        if game_records is None:
+            game_records = seo_optimization.iter_game_metadata()
+
+        pages, values = [], []
+        for page, fields in iter_entries(tool_records, game_records):
+            pages.append(page)
+            values.append(fields)
+
+        jobs = max(1, jobs)
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                rows = list(executor.map(record_sketches, values, chunksize=max(1, len(values) // (jobs * 4))))
+        else:
+            rows = list(map(record_sketches, values))
+        del values
+
+        report = {"version": REPORT_VERSION, "threshold": threshold, "entries": len(pages), "fields": {}}
+        for position, field in enumerate(FIELDS):
+            report["fields"][field] = near_duplicates(pages, [row[position] for row in rows], threshold, limit)
+        instrumentation.add("entries", len(pages))
+        return report
+
+def write_report(report, path=DUPLICATES_FILE):
+    """Write the report, leaving the file alone if nothing changed"""
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return seo_optimization.replace_if_changed(f"{path}.tmp", path)
+
+def summarize(report):
+    """Return one summary line per field"""
+    return [
+        f"{field}: {section['duplicated']} pages in {section['clusters']} clusters, {section['pairs']} pairs"
+        for field, section in report["fields"].items()
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag near-duplicate titles, descriptions and keywords in the catalog")
+    parser.add_argument("--output", default=DUPLICATES_FILE, help=f"report file (default: {DUPLICATES_FILE})")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"Jaccard similarity at which pages are flagged (default: {THRESHOLD})")
+    parser.add_argument("--limit", type=int, default=REPORT_LIMIT,
+                        help=f"clusters, pairs and pages listed per field (default: {REPORT_LIMIT})")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes; 1 runs serially (default: CPU count)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.report:
+        instrumentation.enable()
+
+    with instrumentation.profiled(args.profile):
+        report = find_duplicates(threshold=args.threshold, jobs=args.jobs, limit=args.limit)
+        write_report(report, args.output)
+
+    print(f"Checked {report['entries']} pages at similarity >= {args.threshold}:")
+    for line in summarize(report):
+        print(f"  {line}")
+    for field, section in report["fields"].items():
+        for pair in section["top_pairs"][:5]:
+            print(f"  {field} {pair['similarity']:.2f}: {pair['pages'][0]} ~ {pair['pages'][1]}")
+    print(f"Report written to {args.output}")
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+if __name__ == "__main__":
+    main()
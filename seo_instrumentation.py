@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Lightweight instrumentation for the SEO build scripts.
+
+Stages are timed with ``with stage(name):`` and counters (bytes read/written,
+scan and JSON time, per-file outcomes) are added to the innermost active stage
+with ``add()``. Nothing is recorded until ``enable()`` is called; while
+disabled, ``stage()`` and ``timer()`` return a shared no-op context manager
+and ``add()`` returns immediately. Reports can be written as JSON or in the
+Chrome trace event format (load in chrome://tracing or Perfetto).
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+REPORT_FORMATS = ("json", "trace")
+
+_NULL = nullcontext()
+
+_enabled = False
+_origin = time.perf_counter()
+_stages = {}
+_events = []
+_stack = []
+
+def enable():
+    """Start recording, discarding anything recorded earlier"""
+    global _enabled
+    reset()
+    _enabled = True
+
+def disable():
+    """Stop recording; collected data is kept until the next reset"""
+    global _enabled
+    _enabled = False
+
+def is_enabled():
+    """Return whether instrumentation is recording"""
+    return _enabled
+
+def reset():
+    """Clear all recorded stages and trace events"""
+    global _origin
+    _origin = time.perf_counter()
+    _stages.clear()
+    del _events[:]
+    del _stack[:]
+
+def stage(name):
+    """Time a pipeline stage. Counters added inside it are attributed to it."""
+    if not _enabled:
+        return _NULL
+    return _stage(name)
+
+@contextmanager
+def _stage(name):
+    record = _stages.setdefault(name, {"calls": 0, "wall_seconds": 0.0})
+    before = dict(record)
+    _stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        elapsed = time.perf_counter() - start
+        _stack.pop()
+        record["calls"] += 1
+        record["wall_seconds"] += elapsed
+
+        # Trace events carry this call's counters, not the running totals
+        args = {key: value - before.get(key, 0) for key, value in record.items()
+                if key not in ("calls", "wall_seconds") and value != before.get(key, 0)}
+        _events.append({
+            "name": name,
+            "cat": "seo",
+            "ph": "X",
+            "ts": round((start - _origin) * 1e6, 3),
+            "dur": round(elapsed * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args
+        })
+
+def add(key, amount=1):
+    """Add to a counter on the innermost active stage"""
+    if not _enabled or not _stack:
+        return
+    record = _stages[_stack[-1]]
+    record[key] = record.get(key, 0) + amount
+
+def timer(key):
+    """Accumulate the elapsed seconds of a block into ``key`` on the current stage"""
+    if not _enabled:
+        return _NULL
+    return _timer(key)
+
+@contextmanager
+def _timer(key):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(key, time.perf_counter() - start)
+
+def report():
+    """Return recorded stages as a JSON-serialisable dict"""
+    return {
+        "total_seconds": round(time.perf_counter() - _origin, 6),
+        "stages": {name: dict(record) for name, record in _stages.items()}
+    }
+
+def write_report(path, report_format="json"):
+    """Write the recorded data as a JSON summary or a Chrome trace"""
+    if report_format == "trace":
+        payload = {"traceEvents": list(_events), "displayTimeUnit": "ms"}
+    elif report_format == "json":
+        payload = report()
+    else:
+        raise ValueError(f"Unknown report format: {report_format}")
+
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+@contextmanager
+def profiled(path=None):
+    """Run a block under cProfile and dump the stats to ``path``, if given"""
+    if not path:
+        yield None
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+def add_arguments(parser):
+    """Add the shared --report/--report-format/--profile options to a parser"""
+    parser.add_argument("--report", help="write a per-stage instrumentation report to this file")
+    parser.add_argument("--report-format", choices=REPORT_FORMATS, default="json",
+                        help="report as a JSON summary or a Chrome trace (default: json)")
+    parser.add_argument("--profile", help="run under cProfile and write the stats to this file")
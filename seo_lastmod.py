@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Content-derived lastmod dates for the Edurance Hub sitemap.
+
+Keeps a manifest of every sitemap URL with a hash of what the page is built
+from: the rendered metadata record plus the component source the route maps
+to (or the page component for static pages). A URL's lastmod only moves to
+today when that hash changes, so crawlers are pointed at pages that actually
+changed. Component sources are re-hashed only when their mtime or size moved.
+
+Commit the manifest (.seo_lastmod.json) so dates survive fresh checkouts. It
+holds only each URL's hash and lastmod; the source stats behind the re-hash
+shortcut are machine-local and live in .seo_lastmod_stats.json, which is not
+committed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import date
+
+import component_index
+import seo_instrumentation as instrumentation
+import seo_optimization
+
+LASTMOD_FILE = ".seo_lastmod.json"
+STAT_CACHE_FILE = ".seo_lastmod_stats.json"
+
+# Bump when the page hash inputs change; this re-stamps every URL once
+LASTMOD_VERSION = 1
+
+# Page components behind the STATIC_PAGES paths
+STATIC_PAGE_SOURCES = {
+    "/": "src/pages/Home.tsx",
+    "/tools": "src/pages/Tools.tsx",
+    "/games": "src/pages/Games.tsx",
+    "/about": "src/pages/About.tsx",
+    "/contact": "src/pages/Contact.tsx"
+}
+
+def load_manifest(path=LASTMOD_FILE):
+    """Load the lastmod manifest, starting fresh if it is missing or stale"""
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != LASTMOD_VERSION:
+        manifest = {"version": LASTMOD_VERSION, "urls": {}}
+    return manifest
+
+def load_stat_cache(path=STAT_CACHE_FILE):
+    """Load the source path -> {stat, hash} cache, starting fresh if it is missing or stale"""
+    try:
+        with open(path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = None
+
+    if not isinstance(cache, dict) or cache.get("version") != LASTMOD_VERSION:
+        cache = {"version": LASTMOD_VERSION, "sources": {}}
+    return cache
+
+def save_manifest(manifest, path=LASTMOD_FILE):
+    """Persist the manifest, leaving the file alone if nothing changed"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return seo_optimization.replace_if_changed(tmp_path, path)
+
+def iter_pages(index, tool_records=None, game_records=None):
+    """Yield (loc, content, source_path) for every URL in the sitemap.
+
+    ``content`` is whatever besides the source file determines the page: the
+    metadata record for tools and games, the sitemap settings for static pages.
+    Records are generated from the catalog unless given.
+    """
+    if tool_records is None:
+        tool_records = seo_optimization.iter_tool_metadata()
+    if game_records is None:
+        game_records = seo_optimization.iter_game_metadata()
+
+    routes = index["routes"]
+    for path, changefreq, priority in seo_optimization.STATIC_PAGES:
+        yield f"{seo_optimization.SITE_URL}{path}", [path, changefreq, priority], STATIC_PAGE_SOURCES.get(path)
+    for records in (tool_records, game_records):
+        for record in records:
+            yield record["metadata"]["url"], record["metadata"], routes.get(record["id"])
+
+def hash_source(path, sources):
+    """Return the hash of a source file, reusing the ``sources`` cache entry if its stat is unchanged"""
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    stat = [st.st_mtime_ns, st.st_size]
+    cached = sources.get(path)
+    if cached is not None and cached["stat"] == stat:
+        return cached["hash"]
+    with open(path, "rb") as f:
+        data = f.read()
+    instrumentation.add("bytes_read", len(data))
+    sources[path] = {"stat": stat, "hash": hashlib.sha256(data).hexdigest()}
+    return sources[path]["hash"]
+
+def hash_page(content, source_hash):
+    """Hash a page's content together with its source file hash"""
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update((source_hash or "").encode("ascii"))
+    return digest.hexdigest()
+
+def update_manifest(manifest, pages, today, stats=None, cache=None):
+    """Re-hash pages, bumping lastmod to ``today`` only where the hash changed.
+
+    Returns a loc -> lastmod mapping for the sitemap writer. URLs that are no
+    longer in ``pages`` are dropped from the manifest, and sources no page
+    uses are dropped from the stat ``cache``.
+    """
+    if stats is None:
+        stats = {}
+    for key in ("unchanged", "changed", "added", "removed"):
+        stats.setdefault(key, 0)
+
+    if cache is None:
+        cache = {"version": LASTMOD_VERSION, "sources": {}}
+
+    urls = manifest["urls"]
+    sources = cache["sources"]
+    seen = set()
+    used = set()
+    lastmods = {}
+    for loc, content, source in pages:
+        seen.add(loc)
+        used.add(source)
+        previous = urls.get(loc)
+        source_hash = hash_source(source, sources)
+        page_hash = hash_page(content, source_hash)
+
+        if previous is not None and previous["hash"] == page_hash:
+            lastmod = previous["lastmod"]
+            stats["unchanged"] += 1
+        else:
+            lastmod = today
+            stats["changed" if previous is not None else "added"] += 1
+
+        urls[loc] = {"hash": page_hash, "lastmod": lastmod}
+        lastmods[loc] = lastmod
+
+    for loc in list(urls):
+        if loc not in seen:
+            del urls[loc]
+            stats["removed"] += 1
+    for path in list(sources):
+        if path not in used:
+            del sources[path]
+
+    return lastmods
+
+def build_lastmod(path=LASTMOD_FILE, index=None, today=None, stats=None, persist=True,
+                  stat_cache_file=STAT_CACHE_FILE, tool_records=None, game_records=None):
+    """Update the manifest for the current catalog and sources and return loc -> lastmod"""
+    with instrumentation.stage("lastmod"):
+        if index is None:
+            index = component_index.build_component_index()
+        today = today or date.today().isoformat()
+        manifest = load_manifest(path)
+        cache = load_stat_cache(stat_cache_file)
+        lastmods = update_manifest(manifest, iter_pages(index, tool_records, game_records), today, stats, cache)
+        if persist:
+            save_manifest(manifest, path)
+            save_manifest(cache, stat_cache_file)
+        instrumentation.add("urls", len(lastmods))
+        return lastmods
+
+def main():
+    parser = argparse.ArgumentParser(description="Update content-derived lastmod dates for sitemap URLs")
+    parser.add_argument("--lastmod-file", default=LASTMOD_FILE, help=f"lastmod manifest (default: {LASTMOD_FILE})")
+    parser.add_argument("--today", help="date to stamp changed pages with (default: today)")
+    args = parser.parse_args()
+
+    stats = {}
+    lastmods = build_lastmod(args.lastmod_file, today=args.today, stats=stats)
+    for loc, lastmod in lastmods.items():
+        print(f"{lastmod}  {loc}")
+    print(f"\n{len(lastmods)} URLs: {stats['changed']} changed, {stats['added']} added, "
+          f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,56 @@ SEO Optimization Script for Edurance Hub Tools and Games
 This script generates SEO-optimized metadata for all tools and games.
 """
 
+import argparse
+import filecmp
+import gzip
+import io
 import json
 import os
+import re
+from datetime import date
+from xml.sax.saxutils import escape
+
+import seo_instrumentation as instrumentation
+
+SITE_URL = "https://edurancehub.com"
+
+TOOL_METADATA_JSON = "tool_metadata.json"
+GAME_METADATA_JSON = "game_metadata.json"
+TOOL_METADATA_NDJSON = "tool_metadata.ndjson"
+GAME_METADATA_NDJSON = "game_metadata.ndjson"
+
+# Names the metadata artifact format ("json", "ndjson" or "compact") written
+# most recently. Readers use it rather than mtimes, since an artifact whose
+# content did not change is left alone and keeps its old mtime
+METADATA_ARTIFACT_FILE = ".seo_metadata_artifact"
+
+# Sitemap protocol limits per file (uncompressed)
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_FOOTER = "</urlset>\n"
+
+SITEMAP_INDEX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_INDEX_FOOTER = "</sitemapindex>\n"
+
+LASTMOD_ELEMENT = re.compile(r"<lastmod>([^<]+)</lastmod>")
+
+# Site pages outside the tool/game catalog: (path, changefreq, priority)
+STATIC_PAGES = [
+    ("/", "weekly", "1.0"),
+    ("/tools", "weekly", "0.9"),
+    ("/games", "weekly", "0.9"),
+    ("/about", "monthly", "0.8"),
+    ("/contact", "monthly", "0.8")
+]
 
 # Tool and game data
 TOOLS = {
@@ -64,198 +112,477 @@ GAMES = [
     {"id": "hangman", "name": "Hangman Game", "description": "Classic word guessing game with a twist and multiple categories"}
 ]
 
-def generate_tool_metadata():
-    """Generate SEO metadata for all tools"""
-    tool_metadata = {}
+# Extra keywords added to every tool in a category
+CATEGORY_KEYWORDS = {
+    "health": ["health calculator", "fitness tool", "wellness calculator"],
+    "finance": ["financial calculator", "money tool", "finance calculator"],
+    "student": ["student tool", "education calculator", "academic tool"],
+    "relationship": ["relationship calculator", "love tool", "fun calculator"],
+    "entertainment": ["fun tool", "entertainment calculator", "quiz tool"]
+}
+
+def tool_title(tool):
+    """Render the SEO title for a tool"""
+    return f"Free {tool['name']} Online | {tool['description'].split('.')[0]} | Edurance Hub"
+
+def tool_description(category, tool):
+    """Render the SEO description for a tool"""
+    return f"Free online {tool['name'].lower()} - {tool['description']}. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of {category} tools."
+
+def tool_keywords(category, tool):
+    """Return the SEO keywords for a tool, in order"""
+    name = tool['name'].lower()
+    base_keywords = [
+        name,
+        f"free {name}",
+        f"online {name}",
+        f"{name} calculator",
+        category,
+        f"{category} tools",
+        "free calculator",
+        "online tool",
+        "edurance hub"
+    ]
     
+    # Add specific keywords based on category
+    base_keywords.extend(CATEGORY_KEYWORDS.get(category, ()))
+    return base_keywords
+
+def build_tool_record(category, tool):
+    """Build the SEO metadata record for a single tool"""
+    metadata = {
+        "title": tool_title(tool),
+        "description": tool_description(category, tool),
+        "keywords": ", ".join(tool_keywords(category, tool)),
+        "url": f"{SITE_URL}/tools/{category}/{tool['id']}"
+    }
+    
+    return {
+        "id": tool["id"],
+        "name": tool["name"],
+        "category": category,
+        "metadata": metadata
+    }
+
+def iter_tool_metadata():
+    """Yield an SEO metadata record for each tool, one at a time"""
     for category, tools in TOOLS.items():
-        tool_metadata[category] = []
         for tool in tools:
-            # SEO Title
-            title = f"Free {tool['name']} Online | {tool['description'].split('.')[0]} | Edurance Hub"
-            
-            # SEO Description
-            description = f"Free online {tool['name'].lower()} - {tool['description']}. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of {category} tools."
-            
-            # SEO Keywords
-            base_keywords = [
-                tool['name'].lower(),
-                f"free {tool['name'].lower()}",
-                f"online {tool['name'].lower()}",
-                f"{tool['name'].lower()} calculator",
-                category,
-                f"{category} tools",
-                "free calculator",
-                "online tool",
-                "edurance hub"
-            ]
-            
-            # Add specific keywords based on category
-            if category == "health":
-                base_keywords.extend(["health calculator", "fitness tool", "wellness calculator"])
-            elif category == "finance":
-                base_keywords.extend(["financial calculator", "money tool", "finance calculator"])
-            elif category == "student":
-                base_keywords.extend(["student tool", "education calculator", "academic tool"])
-            elif category == "relationship":
-                base_keywords.extend(["relationship calculator", "love tool", "fun calculator"])
-            elif category == "entertainment":
-                base_keywords.extend(["fun tool", "entertainment calculator", "quiz tool"])
-            
-            keywords = ", ".join(base_keywords)
-            
-            metadata = {
-                "title": title,
-                "description": description,
-                "keywords": keywords,
-                "url": f"https://edurancehub.com/tools/{category}/{tool['id']}"
-            }
-            
-            tool_metadata[category].append({
-                "id": tool["id"],
-                "name": tool["name"],
-                "metadata": metadata
-            })
+            yield build_tool_record(category, tool)
+
+def generate_tool_metadata():
+    """Generate SEO metadata for all tools, grouped by category"""
+    tool_metadata = {category: [] for category in TOOLS}
+    
+    with instrumentation.stage("generate_tool_metadata"):
+        for record in iter_tool_metadata():
+            category = record.pop("category")
+            tool_metadata[category].append(record)
+            instrumentation.add("records")
     
     return tool_metadata
 
-def generate_game_metadata():
-    """Generate SEO metadata for all games"""
-    game_metadata = []
+def game_title(game):
+    """Render the SEO title for a game"""
+    return f"Play {game['name']} Online Free | {game['description']} | Edurance Hub"
+
+def game_description(game):
+    """Render the SEO description for a game"""
+    return f"Play {game['name']} online for free. {game['description']}. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games."
+
+def game_keywords(game):
+    """Return the SEO keywords for a game, in order"""
+    name = game['name'].lower()
+    return [
+        name,
+        f"play {name} online",
+        f"free {name}",
+        f"online {name}",
+        "free game",
+        "online game",
+        "edurance hub",
+        f"{game['description'].split()[0].lower()} game"
+    ]
+
+def build_game_record(game):
+    """Build the SEO metadata record for a single game"""
+    metadata = {
+        "title": game_title(game),
+        "description": game_description(game),
+        "keywords": ", ".join(game_keywords(game)),
+        "url": f"{SITE_URL}/games/{game['id']}"
+    }
     
+    return {
+        "id": game["id"],
+        "name": game["name"],
+        "metadata": metadata
+    }
+
+def iter_game_metadata():
+    """Yield an SEO metadata record for each game, one at a time"""
     for game in GAMES:
-        # SEO Title
-        title = f"Play {game['name']} Online Free | {game['description']} | Edurance Hub"
-        
-        # SEO Description
-        description = f"Play {game['name']} online for free. {game['description']}. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games."
-        
-        # SEO Keywords
-        keywords = f"{game['name'].lower()}, play {game['name'].lower()} online, free {game['name'].lower()}, online {game['name'].lower()}, free game, online game, edurance hub, {game['description'].split()[0].lower()} game"
-        
-        metadata = {
-            "title": title,
-            "description": description,
-            "keywords": keywords,
-            "url": f"https://edurancehub.com/games/{game['id']}"
-        }
-        
-        game_metadata.append({
-            "id": game["id"],
-            "name": game["name"],
-            "metadata": metadata
-        })
-    
+        yield build_game_record(game)
+
+def generate_game_metadata():
+    """Generate SEO metadata for all games"""
+    with instrumentation.stage("generate_game_metadata"):
+        game_metadata = list(iter_game_metadata())
+        instrumentation.add("records", len(game_metadata))
     return game_metadata
 
-def generate_sitemap_entries():
-    """Generate sitemap entries for all tools and games"""
-    print("Generating sitemap entries...")
-    
-    # Tools entries
-    print("\n<!-- Health Tools -->")
-    for tool in TOOLS["health"]:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/tools/health/{tool['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-    
-    print("\n<!-- Finance Tools -->")
-    for tool in TOOLS["finance"]:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/tools/finance/{tool['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-    
-    print("\n<!-- Student Tools -->")
-    for tool in TOOLS["student"]:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/tools/student/{tool['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-    
-    print("\n<!-- Relationship Tools -->")
-    for tool in TOOLS["relationship"]:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/tools/relationship/{tool['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-    
-    print("\n<!-- Entertainment Tools -->")
-    for tool in TOOLS["entertainment"]:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/tools/entertainment/{tool['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-    
-    print("\n<!-- Games -->")
+def iter_sitemap_urls(lastmod=None):
+    """Yield (loc, lastmod, changefreq, priority) for every page in the catalog.
+
+    ``lastmod`` is one date for every URL or a loc -> date mapping (see
+    seo_lastmod); URLs without a date get today's.
+    """
+    today = date.today().isoformat()
+    if isinstance(lastmod, dict):
+        dates = lastmod
+    else:
+        dates = {}
+        today = lastmod or today
+
+    for path, changefreq, priority in STATIC_PAGES:
+        loc = f"{SITE_URL}{path}"
+        yield loc, dates.get(loc, today), changefreq, priority
+
+    for category, tools in TOOLS.items():
+        for tool in tools:
+            loc = f"{SITE_URL}/tools/{category}/{tool['id']}"
+            yield loc, dates.get(loc, today), "monthly", "0.8"
+
     for game in GAMES:
-        print(f"<url>")
-        print(f"  <loc>https://edurancehub.com/games/{game['id']}</loc>")
-        print(f"  <lastmod>2025-08-27</lastmod>")
-        print(f"  <changefreq>monthly</changefreq>")
-        print(f"  <priority>0.8</priority>")
-        print(f"</url>")
-
-def save_metadata_to_file():
-    """Save generated metadata to JSON files"""
-    # Generate tool metadata
-    tool_metadata = generate_tool_metadata()
-    
-    # Generate game metadata
-    game_metadata = generate_game_metadata()
+        loc = f"{SITE_URL}/games/{game['id']}"
+        yield loc, dates.get(loc, today), "monthly", "0.8"
+
+def generate_sitemap_entries(lastmod=None):
+    """Yield a rendered <url> element for every page in the catalog"""
+    for loc, url_lastmod, changefreq, priority in iter_sitemap_urls(lastmod):
+        yield (
+            f"  <url>\n"
+            f"    <loc>{escape(loc)}</loc>\n"
+            f"    <lastmod>{url_lastmod}</lastmod>\n"
+            f"    <changefreq>{changefreq}</changefreq>\n"
+            f"    <priority>{priority}</priority>\n"
+            f"  </url>\n"
+        )
+
+def open_sitemap_file(path, compress=False):
+    """Open a sitemap file for text writing, gzip-compressed if requested.
+
+    Returns the text stream and the underlying binary file, both of which
+    must be closed (see close_sitemap_file).
+    """
+    raw = open(path, "wb")
+    stream = raw
+    if compress:
+        # A fixed mtime and empty embedded name keep the compressed bytes
+        # reproducible between runs and independent of the temp file name
+        stream = gzip.GzipFile(filename="", mode="wb", compresslevel=9, fileobj=raw, mtime=0)
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="\n"), raw
+
+def close_sitemap_file(out, raw):
+    """Close a stream returned by open_sitemap_file"""
+    out.close()
+    raw.close()
+
+def replace_if_changed(tmp_path, path):
+    """Move tmp_path over path unless the contents are identical.
+
+    Leaving unchanged files alone keeps their mtimes stable for caches and
+    conditional requests. Returns True if path was replaced.
+    """
+    if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+def write_sitemap_index(path, shard_paths, lastmod=None):
+    """Write a sitemap index pointing at the given shard files, returning
+    True if the file changed. ``lastmod`` is one date or a list of dates
+    aligned with ``shard_paths``."""
+    if not isinstance(lastmod, list):
+        lastmod = [lastmod] * len(shard_paths)
+    today = date.today().isoformat()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(SITEMAP_INDEX_HEADER)
+        for shard_path, shard_lastmod in zip(shard_paths, lastmod):
+            loc = f"{SITE_URL}/{os.path.basename(shard_path)}"
+            f.write(f"  <sitemap>\n    <loc>{escape(loc)}</loc>\n    <lastmod>{shard_lastmod or today}</lastmod>\n  </sitemap>\n")
+        f.write(SITEMAP_INDEX_FOOTER)
+    return replace_if_changed(tmp_path, path)
+
+def write_sitemap(entries, output_dir="public", base_name="sitemap", compress=False,
+                  max_urls=SITEMAP_MAX_URLS, max_bytes=SITEMAP_MAX_BYTES, stats=None):
+    """Stream rendered <url> entries to disk, one shard at a time.
+
+    A new shard is started whenever the next entry would push the current one
+    past ``max_urls`` URLs or ``max_bytes`` uncompressed bytes, so memory use
+    does not depend on catalog size. A single uncompressed shard is written as
+    ``<base_name>.xml``; otherwise shards are named ``<base_name>-N.xml[.gz]``
+    and ``<base_name>.xml`` becomes a sitemap index. Shards whose bytes did not
+    change are left untouched; ``stats``, if given, counts ``shards_written``
+    and ``shards_unchanged``. Each index entry carries the newest lastmod
+    in its shard. Returns the paths of all sitemap files.
+    """
+    extension = ".xml.gz" if compress else ".xml"
+    header_size = len(SITEMAP_HEADER.encode("utf-8"))
+    footer_size = len(SITEMAP_FOOTER.encode("utf-8"))
+    if stats is None:
+        stats = {}
+    stats.setdefault("shards_written", 0)
+    stats.setdefault("shards_unchanged", 0)
+
+    # Shards are staged in temp files until we know whether there is more than one
+    staged = []
+    shard_lastmods = []
+    out = raw = None
+    count = size = 0
+
+    os.makedirs(output_dir, exist_ok=True)
+    total_urls = 0
+    try:
+        for entry in entries:
+            entry_size = len(entry.encode("utf-8"))
+            if out is not None and (count >= max_urls or size + entry_size + footer_size > max_bytes):
+                out.write(SITEMAP_FOOTER)
+                close_sitemap_file(out, raw)
+                out = None
+
+            if out is None:
+                tmp_path = os.path.join(output_dir, f"{base_name}-{len(staged) + 1}{extension}.tmp")
+                staged.append(tmp_path)
+                shard_lastmods.append(None)
+                out, raw = open_sitemap_file(tmp_path, compress)
+                out.write(SITEMAP_HEADER)
+                count, size = 0, header_size
+
+            out.write(entry)
+            lastmod = LASTMOD_ELEMENT.search(entry)
+            if lastmod and (shard_lastmods[-1] is None or lastmod.group(1) > shard_lastmods[-1]):
+                shard_lastmods[-1] = lastmod.group(1)
+            count += 1
+            size += entry_size
+            total_urls += 1
+    finally:
+        if out is not None:
+            out.write(SITEMAP_FOOTER)
+            close_sitemap_file(out, raw)
+
+    index_path = os.path.join(output_dir, f"{base_name}.xml")
+    if not staged:
+        tmp_path = f"{index_path}.tmp"
+        out, raw = open_sitemap_file(tmp_path)
+        out.write(SITEMAP_HEADER + SITEMAP_FOOTER)
+        close_sitemap_file(out, raw)
+        staged.append(tmp_path)
+        shards = [index_path]
+    elif len(staged) == 1 and not compress:
+        shards = [index_path]
+    else:
+        shards = [tmp_path[:-len(".tmp")] for tmp_path in staged]
+
+    for tmp_path, path in zip(staged, shards):
+        stats["shards_written" if replace_if_changed(tmp_path, path) else "shards_unchanged"] += 1
+
+    written = list(shards)
+    if shards[0] != index_path:
+        stats["shards_written" if write_sitemap_index(index_path, shards, shard_lastmods) else "shards_unchanged"] += 1
+        written.append(index_path)
+
+    # Drop shards left over from a previous, larger run
+    shard_pattern = re.compile(rf"{re.escape(base_name)}-\d+\.xml(\.gz)?$")
+    for name in os.listdir(output_dir):
+        path = os.path.join(output_dir, name)
+        if shard_pattern.match(name) and path not in written:
+            os.remove(path)
+
+    instrumentation.add("urls", total_urls)
+    instrumentation.add("shards", len(staged))
+    instrumentation.add("shards_unchanged", stats["shards_unchanged"])
+    if instrumentation.is_enabled():
+        instrumentation.add("bytes_written", sum(os.path.getsize(path) for path in written))
+    return written
+
+def record_metadata_artifact(artifact, path=METADATA_ARTIFACT_FILE):
+    """Note that the ``artifact`` format now holds the current metadata"""
+    with open(f"{path}.tmp", "w") as f:
+        f.write(f"{artifact}\n")
+    replace_if_changed(f"{path}.tmp", path)
+
+def current_metadata_artifact(path=METADATA_ARTIFACT_FILE):
+    """Return the metadata artifact format written last, or None if none was recorded"""
+    try:
+        with open(path, "r") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def write_ndjson(records, path):
+    """Stream records to a newline-delimited JSON file and return the count.
+
+    The file is staged next to ``path`` and only replaces it if its content
+    changed, so an unchanged artifact keeps its mtime.
+    """
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            with instrumentation.timer("json_seconds"):
+                line = json.dumps(record, separators=(",", ":"))
+            f.write(line)
+            f.write("\n")
+            count += 1
+    instrumentation.add("records", count)
+    if replace_if_changed(tmp_path, path) and instrumentation.is_enabled():
+        instrumentation.add("bytes_written", os.path.getsize(path))
+    return count
+
+def iter_ndjson_records(path):
+    """Lazily yield the records of an NDJSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def read_first_ndjson_record(path):
+    """Return the first record of an NDJSON file, or None if it is empty"""
+    return next(iter_ndjson_records(path), None)
+
+def save_metadata_to_file(tool_metadata=None, game_metadata=None):
+    """Save generated metadata to JSON files, generating it only if not given"""
+    if tool_metadata is None:
+        tool_metadata = generate_tool_metadata()
     
-    # Save to files
-    with open("tool_metadata.json", "w") as f:
-        json.dump(tool_metadata, f, indent=2)
+    if game_metadata is None:
+        game_metadata = generate_game_metadata()
     
-    with open("game_metadata.json", "w") as f:
-        json.dump(game_metadata, f, indent=2)
+    # Save to files, leaving unchanged files (and their mtimes) alone
+    changed = False
+    with instrumentation.stage("save_metadata"):
+        for path, metadata in ((TOOL_METADATA_JSON, tool_metadata), (GAME_METADATA_JSON, game_metadata)):
+            with instrumentation.timer("json_seconds"):
+                payload = json.dumps(metadata, indent=2)
+            with open(f"{path}.tmp", "w") as f:
+                f.write(payload)
+            if replace_if_changed(f"{path}.tmp", path):
+                changed = True
+                instrumentation.add("bytes_written", len(payload))
+    record_metadata_artifact("json")
     
-    print("Metadata saved to tool_metadata.json and game_metadata.json")
+    if changed:
+        print(f"Metadata saved to {TOOL_METADATA_JSON} and {GAME_METADATA_JSON}")
+    else:
+        print(f"Metadata in {TOOL_METADATA_JSON} and {GAME_METADATA_JSON} is already up to date")
+    return changed
+
+def save_metadata_to_ndjson():
+    """Stream generated metadata to NDJSON files without holding the catalog in memory"""
+    with instrumentation.stage("save_tool_ndjson"):
+        tool_count = write_ndjson(iter_tool_metadata(), TOOL_METADATA_NDJSON)
+    with instrumentation.stage("save_game_ndjson"):
+        game_count = write_ndjson(iter_game_metadata(), GAME_METADATA_NDJSON)
+    record_metadata_artifact("ndjson")
+    print(f"Metadata streamed to {TOOL_METADATA_NDJSON} ({tool_count} records) "
+          f"and {GAME_METADATA_NDJSON} ({game_count} records)")
+
+def print_sample_metadata(label, record):
+    """Print the title, description and keywords of one metadata record"""
+    print(f"\nSample {label} Metadata:")
+    print("-" * (len(label) + 17))
+    if record is None:
+        print("(none)")
+        return
+    print(f"Title: {record['metadata']['title']}")
+    print(f"Description: {record['metadata']['description']}")
+    print(f"Keywords: {record['metadata']['keywords']}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate SEO metadata and sitemaps for Edurance Hub")
+    parser.add_argument("--sitemap-dir", default="public", help="directory to write sitemap files to (default: public)")
+    parser.add_argument("--gzip", action="store_true", help="write gzip-compressed sitemap shards behind a sitemap index")
+    parser.add_argument("--lastmod-file", default=".seo_lastmod.json",
+                        help="manifest of content-derived lastmod dates (default: .seo_lastmod.json)")
+    parser.add_argument("--no-lastmod", action="store_true",
+                        help="stamp every sitemap URL with today's date instead of tracking changes")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="stream metadata to newline-delimited JSON instead of building it in memory")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and incrementally regenerate metadata, sitemap and components on change")
+    parser.add_argument("--interval", type=float, default=0.25, help="seconds between polls in --watch mode (default: 0.25)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.watch:
+        # Imported here because the watcher itself imports this module
+        from seo_watch import watch
+        watch(args.interval, args.sitemap_dir, args.gzip)
+        return
+
+    if args.report:
+        instrumentation.enable()
+
+    with instrumentation.profiled(args.profile):
+        run(args)
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+def run(args):
+    """Generate metadata and sitemaps as configured by the parsed arguments"""
     print("Edurance Hub SEO Optimization Tool")
     print("==================================")
     
-    # Generate and display metadata
-    print("\nGenerating SEO metadata for tools...")
-    tool_metadata = generate_tool_metadata()
-    
-    print("\nGenerating SEO metadata for games...")
-    game_metadata = generate_game_metadata()
-    
-    # Save metadata to files
-    save_metadata_to_file()
+    if args.ndjson:
+        # Records are generated and written one at a time
+        print("\nStreaming SEO metadata for tools and games...")
+        save_metadata_to_ndjson()
+        sample_tool = read_first_ndjson_record(TOOL_METADATA_NDJSON)
+        sample_game = read_first_ndjson_record(GAME_METADATA_NDJSON)
+        # Read back lazily for lastmod rather than generating the catalog again
+        tool_records = iter_ndjson_records(TOOL_METADATA_NDJSON)
+        game_records = iter_ndjson_records(GAME_METADATA_NDJSON)
+    else:
+        print("\nGenerating SEO metadata for tools...")
+        tool_metadata = generate_tool_metadata()
+        
+        print("\nGenerating SEO metadata for games...")
+        game_metadata = generate_game_metadata()
+        
+        # Save the metadata generated above rather than generating it again
+        save_metadata_to_file(tool_metadata, game_metadata)
+        sample_tool = tool_metadata["health"][0]  # Water Intake Calculator
+        sample_game = game_metadata[0]  # Math Roast Game
+        tool_records = [record for records in tool_metadata.values() for record in records]
+        game_records = game_metadata
     
     # Display sample metadata
-    print("\nSample Tool Metadata:")
-    print("---------------------")
-    sample_tool = tool_metadata["health"][0]  # Water Intake Calculator
-    print(f"Title: {sample_tool['metadata']['title']}")
-    print(f"Description: {sample_tool['metadata']['description']}")
-    print(f"Keywords: {sample_tool['metadata']['keywords']}")
+    print_sample_metadata("Tool", sample_tool)
+    print_sample_metadata("Game", sample_game)
     
-    print("\nSample Game Metadata:")
-    print("---------------------")
-    sample_game = game_metadata[0]  # Math Roast Game
-    print(f"Title: {sample_game['metadata']['title']}")
-    print(f"Description: {sample_game['metadata']['description']}")
-    print(f"Keywords: {sample_game['metadata']['keywords']}")
+    lastmod = None
+    if not args.no_lastmod:
+        # Imported here because seo_lastmod itself imports this module
+        from seo_lastmod import build_lastmod
+        stats = {}
+        lastmod = build_lastmod(args.lastmod_file, stats=stats, tool_records=tool_records,
+                                game_records=game_records)
+        print(f"\nLastmod: {stats['changed']} changed, {stats['added']} added, "
+              f"{stats['removed']} removed, {stats['unchanged']} unchanged")
     
-    print("\nSitemap Entries:")
-    print("----------------")
-    generate_sitemap_entries()
+    print("\nWriting sitemap...")
+    print("------------------")
+    with instrumentation.stage("write_sitemap"):
+        written = write_sitemap(generate_sitemap_entries(lastmod), args.sitemap_dir, compress=args.gzip)
+    for path in written:
+        print(f"Wrote {path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the Edurance Hub SEO pipeline.
+
+Generates tool and game metadata, writes the sitemap and patches components in
+one process. Metadata records are built once and handed to every stage that
+needs them, streaming straight from the generators when patching is the only
+consumer. When several stages read them, only compact records (see
+seo_compact) or the NDJSON artifacts are kept, and each stage renders the full
+records one at a time, so memory stays flat. The metadata files (JSON, NDJSON or compact) are optional
+artifacts: they are only written when asked for, and only replaced when their
+content changed, so their mtimes stay usable as cache keys. Paths are resolved
+against the project root rather than the caller's working directory.
+
+    from seo_pipeline import run_pipeline
+    summary = run_pipeline(jobs=4, artifacts="json")
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import add_seo_to_components
+import component_index
+import route_manifest
+import seo_compact
+import seo_duplicates
+import seo_instrumentation as instrumentation
+import seo_lastmod
+import seo_optimization
+import seo_prerender
+import seo_search_index
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+ARTIFACT_FORMATS = ("json", "ndjson", "compact")
+
+@contextmanager
+def working_directory(path):
+    """Temporarily change the working directory"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+def tee_ndjson(records, path, counts, key):
+    """Yield records while streaming them to an NDJSON artifact.
+
+    The file is staged next to ``path`` and only replaces it once every record
+    has been written and the content actually changed.
+    """
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+            yield record
+    seo_optimization.replace_if_changed(tmp_path, path)
+    seo_optimization.record_metadata_artifact("ndjson")
+    counts[key] = count
+
+class RecordSource:
+    """Re-iterable records: every pass calls ``factory`` for a fresh iterator"""
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __iter__(self):
+        return iter(self.factory())
+
+def metadata_records(artifacts, counts, shared=False):
+    """Return (tool_records, game_records) iterables, writing artifacts if asked.
+
+    With ``shared``, several stages read the records, so the iterables can be
+    walked more than once (see RecordSource); otherwise they are single-pass.
+    """
+    if artifacts is not None and artifacts not in ARTIFACT_FORMATS:
+        raise ValueError(f"Unknown artifact format: {artifacts}")
+
+    if artifacts == "json":
+        tool_metadata = seo_optimization.generate_tool_metadata()
+        game_metadata = seo_optimization.generate_game_metadata()
+        seo_optimization.save_metadata_to_file(tool_metadata, game_metadata)
+        tool_records = [record for records in tool_metadata.values() for record in records]
+        counts["tools"], counts["games"] = len(tool_records), len(game_metadata)
+        return tool_records, game_metadata
+
+    if artifacts == "ndjson":
+        paths = (seo_optimization.TOOL_METADATA_NDJSON, seo_optimization.GAME_METADATA_NDJSON)
+        records = (tee_ndjson(seo_optimization.iter_tool_metadata(), paths[0], counts, "tools"),
+                   tee_ndjson(seo_optimization.iter_game_metadata(), paths[1], counts, "games"))
+        if not shared:
+            return records
+        # Finish the artifacts, then let every stage read them back lazily
+        for tee in records:
+            for _ in tee:
+                pass
+        return tuple(RecordSource(lambda path=path: seo_optimization.iter_ndjson_records(path)) for path in paths)
+
+    if artifacts == "compact" or shared:
+        dictionary, tool_records, game_records = seo_compact.generate_compact_metadata()
+        if artifacts == "compact":
+            seo_compact.write_compact_metadata(dictionary, tool_records, game_records)
+        counts["tools"], counts["games"] = len(tool_records), len(game_records)
+        if shared:
+            return (RecordSource(lambda: seo_compact.render_records(tool_records, dictionary)),
+                    RecordSource(lambda: seo_compact.render_records(game_records, dictionary)))
+        return (seo_compact.render_records(tool_records, dictionary),
+                seo_compact.render_records(game_records, dictionary))
+
+    return seo_optimization.iter_tool_metadata(), seo_optimization.iter_game_metadata()
+
+def count_records(records, counts, key):
+    """Yield records, counting them into ``counts[key]``"""
+    counts[key] = 0
+    for record in records:
+        counts[key] += 1
+        yield record
+
+def run_pipeline(root=ROOT, artifacts=None, sitemap=True, sitemap_dir="public", compress=False, patch=True,
+                 jobs=1, use_cache=True, cache_file=add_seo_to_components.CACHE_FILE,
+                 index_file=component_index.INDEX_FILE, lastmod=True, lastmod_file=seo_lastmod.LASTMOD_FILE,
+                 prerender_dir=None, manifest=True, search_index=True, duplicates=True):
+    """Run generation, patching and the sitemap in one process.
+
+    ``artifacts`` is None (keep metadata in memory), "json", "ndjson" or
+    "compact" (see seo_compact). The sitemap is written last so that, with
+    ``lastmod``, its dates reflect the patched component sources. With
+    ``prerender_dir`` (a built site such as "dist"), every route also gets a
+    static index.html with its head pre-rendered (see seo_prerender).
+    Returns a summary dict with record counts, written sitemap files, the
+    component patch stats (None when patching is skipped), the lastmod stats
+    (None when lastmod tracking is off) and the pre-render stats (None when
+    not pre-rendering). With ``manifest``, the lazy route manifest module
+    (see route_manifest) is regenerated from the catalog, and with
+    ``search_index`` so is the client search index (see seo_search_index).
+    With ``duplicates``, near-duplicate titles, descriptions and keywords are
+    reported to seo_duplicates.json and summarised under "duplicates".
+    Precompression is not a stage here: it has to run on the build output
+    after `vite build` has copied this run's public/ files (see
+    seo_precompress).
+    """
+    counts = {}
+    summary = {"tools": 0, "games": 0, "sitemap": [], "components": None, "lastmod": None, "prerender": None,
+               "manifest": None, "search_index": None, "duplicates": None}
+
+    with working_directory(root):
+        # Each of these stages walks the whole catalog; generate it once and
+        # let them share the records rather than regenerating it per stage
+        shared = bool(manifest or search_index or duplicates or prerender_dir or (sitemap and lastmod))
+        tool_records, game_records = metadata_records(artifacts, counts, shared)
+        if artifacts != "ndjson" and not shared:
+            tool_records = count_records(tool_records, counts, "tools")
+            game_records = count_records(game_records, counts, "games")
+
+        index = None
+        if patch or manifest or (sitemap and lastmod):
+            index = component_index.build_component_index(index_file, persist=use_cache)
+
+        if manifest:
+            summary["manifest"] = {}
+            route_manifest.write_route_manifest(index=index, tool_records=tool_records,
+                                               game_records=game_records, stats=summary["manifest"])
+
+        if search_index:
+            summary["search_index"] = {}
+            seo_search_index.write_search_index(tool_records=tool_records, game_records=game_records,
+                                                stats=summary["search_index"])
+
+        if duplicates:
+            report = seo_duplicates.find_duplicates(tool_records, game_records, jobs=jobs)
+            seo_duplicates.write_report(report)
+            summary["duplicates"] = report
+
+        if patch:
+            with instrumentation.stage("load_cache"):
+                cache = add_seo_to_components.load_cache(cache_file) if use_cache else None
+            stats = add_seo_to_components.new_stats()
+            jobs = max(1, jobs)
+            executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+            try:
+                add_seo_to_components.process_tools(cache, stats, executor, jobs, index, tool_records)
+                add_seo_to_components.process_games(cache, stats, executor, jobs, index, game_records)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            if cache is not None:
+                with instrumentation.stage("save_cache"):
+                    add_seo_to_components.save_cache(cache, cache_file)
+            summary["components"] = stats
+        elif not shared:
+            # Nothing consumes the records, so drain them to finish any artifact
+            for records in (tool_records, game_records):
+                for _ in records:
+                    pass
+
+        if sitemap:
+            dates = None
+            if lastmod:
+                summary["lastmod"] = {}
+                dates = seo_lastmod.build_lastmod(lastmod_file, index, stats=summary["lastmod"], persist=use_cache,
+                                                  tool_records=tool_records, game_records=game_records)
+            with instrumentation.stage("write_sitemap"):
+                summary["sitemap"] = seo_optimization.write_sitemap(
+                    seo_optimization.generate_sitemap_entries(dates), sitemap_dir, compress=compress)
+
+        if prerender_dir:
+            summary["prerender"] = {}
+            seo_prerender.prerender(prerender_dir, jobs=jobs, tool_records=tool_records,
+                                    game_records=game_records, stats=summary["prerender"])
+
+    summary["tools"] = counts.get("tools", 0)
+    summary["games"] = counts.get("games", 0)
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the whole Edurance Hub SEO pipeline in one process")
+    parser.add_argument("--root", default=ROOT, help="project root (default: the directory of this script)")
+    parser.add_argument("--artifacts", choices=ARTIFACT_FORMATS,
+                        help="also write the metadata as JSON, NDJSON or compact files (default: keep it in memory)")
+    parser.add_argument("--sitemap-dir", default="public", help="directory to write sitemap files to (default: public)")
+    parser.add_argument("--gzip", action="store_true", help="write gzip-compressed sitemap shards behind a sitemap index")
+    parser.add_argument("--no-sitemap", action="store_true", help="skip writing the sitemap")
+    parser.add_argument("--no-patch", action="store_true", help="skip patching components")
+    parser.add_argument("--no-lastmod", action="store_true",
+                        help="stamp every sitemap URL with today's date instead of tracking changes")
+    parser.add_argument("--lastmod-file", default=seo_lastmod.LASTMOD_FILE,
+                        help=f"manifest of content-derived lastmod dates (default: {seo_lastmod.LASTMOD_FILE})")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the component cache")
+    parser.add_argument("--no-route-manifest", action="store_true", help="skip regenerating the lazy route manifest")
+    parser.add_argument("--no-search-index", action="store_true", help="skip rebuilding the client search index")
+    parser.add_argument("--no-duplicates", action="store_true", help="skip the near-duplicate metadata report")
+    parser.add_argument("--prerender", metavar="BUILD_DIR",
+                        help="also pre-render route heads into this built site, e.g. dist")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes; 1 runs serially (default: CPU count)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.report:
+        instrumentation.enable()
+
+    with instrumentation.profiled(args.profile):
+        summary = run_pipeline(args.root, args.artifacts, not args.no_sitemap, args.sitemap_dir, args.gzip,
+                               not args.no_patch, args.jobs, not args.no_cache,
+                               lastmod=not args.no_lastmod, lastmod_file=args.lastmod_file,
+                               prerender_dir=args.prerender, manifest=not args.no_route_manifest,
+                               search_index=not args.no_search_index, duplicates=not args.no_duplicates)
+
+    print(f"\n{summary['tools']} tool and {summary['games']} game records")
+    if summary["lastmod"] is not None:
+        lastmod = summary["lastmod"]
+        print(f"Lastmod: {lastmod['changed']} changed, {lastmod['added']} added, "
+              f"{lastmod['removed']} removed, {lastmod['unchanged']} unchanged")
+    for path in summary["sitemap"]:
+        print(f"Wrote {path}")
+    if summary["manifest"] is not None:
+        for route_id in summary["manifest"]["missing"]:
+            print(f"No component found for {route_id}; left out of the route manifest")
+        print(f"Route manifest: {summary['manifest']['routes']} routes")
+    if summary["search_index"] is not None:
+        search_index = summary["search_index"]
+        print(f"Search index: {search_index['docs']} documents, {search_index['terms']} terms, "
+              f"{search_index['bytes']} bytes")
+    if summary["duplicates"] is not None:
+        print(f"Near duplicates (written to {seo_duplicates.DUPLICATES_FILE}):")
+        for line in seo_duplicates.summarize(summary["duplicates"]):
+            print(f"  {line}")
+    if summary["prerender"] is not None:
+        print("Pre-render: " + ", ".join(f"{summary['prerender'][status]} {status}" for status in seo_prerender.STATUSES))
+    stats = summary["components"]
+    if stats is not None:
+        print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, {stats['written']} files written")
+        print("Results: " + ", ".join(f"{stats[status]} {status}" for status in add_seo_to_components.STATUSES))
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+if __name__ == "__main__":
+    main()
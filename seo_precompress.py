@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Precompress the built site for static serving.
+
+Writes a .gz sibling (gzip level 9) and, when the brotli module is installed,
+a .br sibling (quality 11) next to every text asset under the given files or
+directories: the Vite build in dist/ by default, which also holds the copied
+sitemap, robots.txt and search index. Hosts that serve precompressed files
+can then skip compressing on every request. A sibling is only kept when it is
+smaller than the original. Point it at the build output rather than public/:
+siblings written there would sit untracked next to the sources and be copied
+into every build.
+
+Run it as the last step, after seo_pipeline has written the sitemap and
+search index to public/, `npm run build` has copied them into dist/ and any
+seo_prerender pass:
+
+    python seo_pipeline.py && npm run build && python seo_precompress.py
+
+Files are compressed in parallel. Their content hashes are kept in
+.seo_precompress.json, and files whose hash (checked only when their mtime or
+size moved) is unchanged and whose siblings exist are skipped.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PRECOMPRESS_FILE = ".seo_precompress.json"
+
+MANIFEST_VERSION = 1
+
+DEFAULT_PATHS = ["dist"]
+
+# Text assets worth compressing; already-compressed files are never touched
+EXTENSIONS = (".html", ".xml", ".txt", ".json", ".js", ".css", ".svg", ".webmanifest")
+
+STATUSES = ("written", "unchanged", "error")
+
+def encodings():
+    """Return the (extension, compress) pairs available in this environment"""
+    available = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        available.append((".br", lambda data: brotli.compress(data, quality=11)))
+    return available
+
+def load_manifest(path=PRECOMPRESS_FILE):
+    """Load the hash manifest, starting fresh if it is missing or stale"""
+    try:
+        with open(path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION, "files": {}}
+    return manifest
+
+def save_manifest(manifest, path=PRECOMPRESS_FILE):
+    """Persist the manifest, leaving the file alone if nothing changed"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return seo_optimization.replace_if_changed(tmp_path, path)
+
+def iter_files(paths):
+    """Yield every compressible file under ``paths`` in a stable order"""
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for directory, subdirectories, files in os.walk(path):
+            subdirectories.sort()
+            for name in sorted(files):
+                if name.endswith(EXTENSIONS):
+                    yield os.path.join(directory, name)
+
+def siblings_present(path, entry):
+    """True if every sibling the entry records as written still exists"""
+    return all(size is None or os.path.exists(path + extension) for extension, size in entry["sizes"].items())
+
+def compress_file(task):
+    """Compress one file unless its hash matches ``previous``; returns (path, status, entry, error)"""
+    path, stat, previous = task
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        extensions = [extension for extension, _ in encodings()]
+        if (previous is not None and previous["hash"] == digest and set(previous["sizes"]) == set(extensions)
+                and siblings_present(path, previous)):
+            return path, "unchanged", dict(previous, stat=stat), None
+
+        sizes = {}
+        for extension, compress in encodings():
+            compressed = compress(data)
+            sibling = path + extension
+            if len(compressed) < len(data):
+                with open(f"{sibling}.tmp", "wb") as f:
+                    f.write(compressed)
+                seo_optimization.replace_if_changed(f"{sibling}.tmp", sibling)
+                sizes[extension] = len(compressed)
+            else:
+                # Not worth serving; drop a stale sibling from an earlier run
+                if os.path.exists(sibling):
+                    os.remove(sibling)
+                sizes[extension] = None
+        return path, "written", {"hash": digest, "stat": stat, "size": len(data), "sizes": sizes}, None
+    except OSError as e:
+        return path, "error", None, str(e)
+
+def precompress(paths=None, manifest_file=PRECOMPRESS_FILE, jobs=1, stats=None, use_cache=True):
+    """Precompress every asset under ``paths`` and return {path: entry} for them"""
+    with instrumentation.stage("precompress"):
+        if stats is None:
+            stats = {}
+        for status in STATUSES:
+            stats.setdefault(status, 0)
+
+        manifest = load_manifest(manifest_file) if use_cache else {"version": MANIFEST_VERSION, "files": {}}
+        files = manifest["files"]
+        extensions = {extension for extension, _ in encodings()}
+        entries = {}
+        tasks = []
+        paths = paths or DEFAULT_PATHS
+        for path in paths:
+            if not os.path.exists(path):
+                print(f"{path} not found; nothing to precompress there (run `npm run build` first?)")
+        for path in iter_files(paths):
+            st = os.stat(path)
+            stat = [st.st_mtime_ns, st.st_size]
+            previous = files.get(path)
+            if (previous is not None and previous["stat"] == stat and set(previous["sizes"]) == extensions
+                    and siblings_present(path, previous)):
+                entries[path] = previous
+                stats["unchanged"] += 1
+            else:
+                tasks.append((path, stat, previous))
+
+        jobs = max(1, jobs)
+        if jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(compress_file, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+        else:
+            results = list(map(compress_file, tasks))
+
+        for path, status, entry, error in results:
+            stats[status] += 1
+            if status == "error":
+                print(f"Error precompressing {path}: {error}")
+                continue
+            entries[path] = entry
+            if status == "written":
+                instrumentation.add("bytes_written", sum(size for size in entry["sizes"].values() if size))
+
+        # Drop manifest entries for files that are gone from the scanned paths
+        manifest["files"] = dict(sorted({**{path: entry for path, entry in files.items() if os.path.exists(path)},
+                                         **entries}.items()))
+        if use_cache:
+            save_manifest(manifest, manifest_file)
+        instrumentation.add("files", len(entries))
+        return entries
+
+def savings_lines(entries):
+    """Return one report line per file plus a total line"""
+    extensions = [extension for extension, _ in encodings()]
+    lines = []
+    total = {extension: 0 for extension in extensions}
+    original = 0
+    for path, entry in entries.items():
+        original += entry["size"]
+        columns = []
+        for extension in extensions:
+            size = entry["sizes"].get(extension)
+            total[extension] += size if size is not None else entry["size"]
+            if size is None:
+                columns.append(f"{extension} skipped")
+            else:
+                columns.append(f"{extension} {size} (-{100 - 100 * size / entry['size']:.0f}%)")
+        lines.append(f"{path}: {entry['size']} bytes -> " + ", ".join(columns))
+
+    if original:
+        lines.append(f"Total: {original} bytes -> " + ", ".join(
+            f"{extension} {total[extension]} (saved {original - total[extension]})" for extension in extensions))
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br siblings for the assets of a built site")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS,
+                        help=f"files or directories to precompress (default: {' '.join(DEFAULT_PATHS)})")
+    parser.add_argument("--manifest-file", default=PRECOMPRESS_FILE,
+                        help=f"content hash manifest (default: {PRECOMPRESS_FILE})")
+    parser.add_argument("--no-cache", action="store_true", help="recompress every file, ignoring the manifest")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes; 1 runs serially (default: CPU count)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.report:
+        instrumentation.enable()
+    if brotli is None:
+        print("brotli is not installed; writing .gz siblings only (pip install brotli for .br)")
+
+    stats = {}
+    with instrumentation.profiled(args.profile):
+        entries = precompress(args.paths, args.manifest_file, args.jobs, stats, use_cache=not args.no_cache)
+
+    for line in savings_lines(entries):
+        print(line)
+    print(f"\nPrecompressed {len(entries)} files: " + ", ".join(f"{stats[status]} {status}" for status in STATUSES))
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+if __name__ == "__main__":
+    main()
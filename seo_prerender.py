@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Pre-render static <head> markup for every tool, game and static route.
+
+Takes the built index.html (dist/index.html by default) and writes one copy
+per route, e.g. dist/tools/health/bmi-calculator/index.html, with the title,
+meta/Open Graph/Twitter tags, canonical link and JSON-LD already in <head>.
+Metadata comes from the generated tool/game records and page SEO and
+structured data from src/config/seoConfig.ts, so crawlers and first paint get
+complete heads without waiting for React. Blog posts are not pre-rendered:
+src/App.tsx has no /blog/* route, so those pages would be soft 404s.
+Routes are rendered in parallel and files whose bytes did not change are left
+untouched.
+
+The build's own index.html is never rewritten: hosts serve it as the SPA
+fallback for every route without a file of its own, so a head baked into it
+would claim the home page's canonical for all of them. The home route goes to
+index.prerendered.html instead; point the host's "/" at it (e.g. a rewrite).
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+from ts_literals import read_exports
+
+SEO_CONFIG = "src/config/seoConfig.ts"
+
+OUTPUT_DIR = "dist"
+
+# Where the "/" route is written, next to the untouched SPA shell
+HOME_FILE = "index.prerendered.html"
+
+# Marks the block this script inserts so re-runs replace it instead of stacking
+HEAD_START = "<!-- seo:prerender -->"
+HEAD_END = "<!-- /seo:prerender -->"
+PRERENDERED_HEAD = re.compile(rf"\s*{re.escape(HEAD_START)}.*?{re.escape(HEAD_END)}", re.S)
+
+TITLE = re.compile(r"<title>.*?</title>", re.S)
+
+# react-helmet 6 only replaces head tags carrying this attribute; without it
+# the static tags would outlive client-side navigation next to Helmet's own
+HELMET_ATTRIBUTE = 'data-react-helmet="true"'
+
+STATIC_ROUTES = {
+    "/": ("home", ["homeStructuredData", "organizationStructuredData", "faqStructuredData"]),
+    "/tools": ("tools", ["toolsStructuredData"]),
+    "/games": ("games", ["gamesStructuredData"]),
+    "/about": ("about", []),
+    "/contact": ("contact", [])
+}
+
+CATEGORY_APPLICATIONS = {
+    "health": "HealthApplication",
+    "finance": "FinanceApplication",
+    "student": "EducationalApplication"
+}
+
+STATUSES = ("written", "unchanged", "error")
+
+# Template, output directory and site config shared by every route; set once
+# per worker process rather than pickled with each task
+_shared = {}
+
+def init_worker(template, output_dir, site):
+    """Install the per-run settings in this process"""
+    _shared.update(template=template, output_dir=output_dir, site=site)
+
+def breadcrumbs(items):
+    """Mirror breadcrumbStructuredData from seoConfig.ts"""
+    return {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": position, "name": name, "item": url}
+            for position, (name, url) in enumerate(items, 1)
+        ]
+    }
+
+def iter_routes(config, tool_records, game_records):
+    """Yield (path, head) for every route, where head holds the tags to render"""
+    site_url = seo_optimization.SITE_URL
+    pages = config.get("pageSEO", {})
+
+    for path, (page, structured) in STATIC_ROUTES.items():
+        seo = pages.get(page)
+        if seo is None:
+            continue
+        yield path, {
+            "title": seo["title"],
+            "description": seo["description"],
+            "keywords": seo["keywords"],
+            "url": site_url if path == "/" else f"{site_url}{path}",
+            "type": "website",
+            "jsonld": [config[name] for name in structured if name in config]
+        }
+
+    for record in tool_records:
+        metadata = record["metadata"]
+        category = metadata["url"].rsplit("/", 2)[-2]
+        yield f"/tools/{category}/{record['id']}", {
+            "title": metadata["title"],
+            "description": metadata["description"],
+            "keywords": metadata["keywords"],
+            "url": metadata["url"],
+            "type": "website",
+            "jsonld": [
+                {
+                    "@context": "https://schema.org",
+                    "@type": "SoftwareApplication",
+                    "name": record["name"],
+                    "description": metadata["description"],
+                    "url": metadata["url"],
+                    "applicationCategory": CATEGORY_APPLICATIONS.get(category, "UtilitiesApplication"),
+                    "operatingSystem": "Web",
+                    "offers": {"@type": "Offer", "price": "0", "priceCurrency": "USD"}
+                },
+                breadcrumbs([("Home", site_url), ("Tools", f"{site_url}/tools"), (record["name"], metadata["url"])])
+            ]
+        }
+
+    for record in game_records:
+        metadata = record["metadata"]
+        yield f"/games/{record['id']}", {
+            "title": metadata["title"],
+            "description": metadata["description"],
+            "keywords": metadata["keywords"],
+            "url": metadata["url"],
+            "type": "website",
+            "jsonld": [
+                {
+                    "@context": "https://schema.org",
+                    "@type": "Game",
+                    "name": record["name"],
+                    "description": metadata["description"],
+                    "url": metadata["url"],
+                    "operatingSystem": "Web"
+                },
+                breadcrumbs([("Home", site_url), ("Games", f"{site_url}/games"), (record["name"], metadata["url"])])
+            ]
+        }
+
+def render_head(head, site):
+    """Render the tags for one route"""
+    attr = lambda value: html.escape(str(value), quote=True)
+    image = head.get("image") or site["logo"]
+    lines = [
+        f'<meta name="description" content="{attr(head["description"])}" />',
+        f'<meta name="keywords" content="{attr(head["keywords"])}" />',
+        '<meta name="author" content="Edurance Hub" />',
+        f'<meta property="og:title" content="{attr(head["title"])}" />',
+        f'<meta property="og:description" content="{attr(head["description"])}" />',
+        f'<meta property="og:type" content="{head["type"]}" />',
+        f'<meta property="og:url" content="{attr(head["url"])}" />',
+        f'<meta property="og:image" content="{attr(image)}" />',
+        f'<meta property="og:site_name" content="{attr(site["name"])}" />',
+        f'<meta property="og:locale" content="{attr(site["locale"])}" />',
+        '<meta name="twitter:card" content="summary_large_image" />',
+        f'<meta name="twitter:title" content="{attr(head["title"])}" />',
+        f'<meta name="twitter:description" content="{attr(head["description"])}" />',
+        f'<meta name="twitter:image" content="{attr(image)}" />',
+        f'<link rel="canonical" href="{attr(head["url"])}" />'
+    ]
+    for data in head["jsonld"]:
+        # "</" would end the script element early
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+        lines.append(f'<script type="application/ld+json">{payload}</script>')
+    lines = [line.replace(" ", f" {HELMET_ATTRIBUTE} ", 1) for line in lines]
+    return "\n    ".join([HEAD_START] + lines + [HEAD_END])
+
+def render_page(template, head, site):
+    """Return the template with the route's title and head block in place"""
+    page = PRERENDERED_HEAD.sub("", template)
+    title = f"<title>{html.escape(head['title'], quote=False)}</title>"
+    page, count = TITLE.subn(lambda _: title, page, count=1)
+    block = render_head(head, site) if count else f"{title}\n    {render_head(head, site)}"
+    return page.replace("</head>", f"  {block}\n  </head>", 1)
+
+def route_file(output_dir, path):
+    """Map a route path to its index.html under the output directory"""
+    if path == "/":
+        return os.path.join(output_dir, HOME_FILE)
+    return os.path.join(output_dir, *[part for part in path.split("/") if part], "index.html")
+
+def prerender_route(task):
+    """Render one (path, head) route and write it if its bytes changed"""
+    path, head = task
+    file_path = route_file(_shared["output_dir"], path)
+    try:
+        data = render_page(_shared["template"], head, _shared["site"]).encode("utf-8")
+        try:
+            with open(file_path, "rb") as f:
+                if f.read() == data:
+                    return file_path, "unchanged", None, len(data)
+        except OSError:
+            pass
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+        return file_path, "written", None, len(data)
+    except Exception as e:
+        return file_path, "error", str(e), 0
+
+def read_template(path):
+    """Read the HTML shell, dropping any head block a previous run inserted"""
+    with open(path, "r", encoding="utf-8") as f:
+        return PRERENDERED_HEAD.sub("", f.read())
+
+def prerender(output_dir=OUTPUT_DIR, template_path=None, jobs=1, tool_records=None, game_records=None,
+              config_path=SEO_CONFIG, stats=None):
+    """Write a pre-rendered index.html for every route and return their paths"""
+    with instrumentation.stage("prerender"):
+        if stats is None:
+            stats = {}
+        for status in STATUSES:
+            stats.setdefault(status, 0)
+
+        template = read_template(template_path or os.path.join(output_dir, "index.html"))
+        config = read_exports(config_path)
+        if tool_records is None:
+            tool_records = seo_optimization.iter_tool_metadata()
+        if game_records is None:
+            game_records = seo_optimization.iter_game_metadata()
+
+        settings = (template, output_dir, config["siteConfig"])
+        tasks = list(iter_routes(config, tool_records, game_records))
+
+        jobs = max(1, jobs)
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=settings) as executor:
+                results = list(executor.map(prerender_route, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+        else:
+            init_worker(*settings)
+            results = list(map(prerender_route, tasks))
+
+        written = []
+        for file_path, status, error, size in results:
+            stats[status] += 1
+            if status == "error":
+                print(f"Error pre-rendering {file_path}: {error}")
+                continue
+            written.append(file_path)
+            if status == "written":
+                instrumentation.add("bytes_written", size)
+        instrumentation.add("routes", len(tasks))
+        return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render static <head> markup for every route")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help=f"build directory to write routes into (default: {OUTPUT_DIR})")
+    parser.add_argument("--template", help="HTML shell to render from (default: <output-dir>/index.html)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes; 1 runs serially (default: CPU count)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args()
+
+    template = args.template or os.path.join(args.output_dir, "index.html")
+    if not os.path.exists(template):
+        parser.error(f"{template} not found; run `npm run build` first or pass --template index.html")
+
+    if args.report:
+        instrumentation.enable()
+
+    stats = {}
+    with instrumentation.profiled(args.profile):
+        written = prerender(args.output_dir, template, args.jobs, stats=stats)
+
+    print(f"Pre-rendered {len(written)} routes into {args.output_dir}: "
+          + ", ".join(f"{stats[status]} {status}" for status in STATUSES))
+
+    if args.report:
+        instrumentation.write_report(args.report, args.report_format)
+        print(f"\nInstrumentation report written to {args.report}")
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Build the prebuilt client search index for tools, games and blog posts.
+
+Tokenizes every tool and game record (name, title, description, keywords,
+category) and every post in src/data/blogData.ts (title, description, author,
+category, tags) into an inverted index and writes it to
+public/search-index.json, which the site fetches once (see
+src/data/searchIndex.ts). The artifact holds:
+
+    {"version": 1,
+     "docs": [[type, id, title, path], ...],
+     "terms": [sorted tokens],
+     "postings": [[delta-encoded doc numbers], ...]}
+
+Terms are sorted so a query token is answered by a binary search for the
+range of terms it prefixes, then a union of their postings; multi-token
+queries intersect those sets. The file is only replaced when its content
+changes.
+"""
+
+import argparse
+import json
+import os
+import re
+
+import seo_instrumentation as instrumentation
+import seo_optimization
+from ts_literals import read_exports
+
+BLOG_DATA = "src/data/blogData.ts"
+
+SEARCH_INDEX_FILE = "public/search-index.json"
+
+# Bump together with SEARCH_INDEX_VERSION in src/data/searchIndex.ts
+SEARCH_INDEX_VERSION = 1
+
+# Must match tokenize() in src/data/searchIndex.ts
+TOKEN = re.compile(r"[a-z0-9]+")
+
+def tokenize(*texts):
+    """Return the set of lowercase alphanumeric tokens in ``texts``"""
+    tokens = set()
+    for text in texts:
+        tokens.update(TOKEN.findall(str(text).lower()))
+    return tokens
+
+def load_posts(blog_path=BLOG_DATA):
+    """Read the static blog posts (featured article first) from blogData.ts"""
+    if not os.path.exists(blog_path):
+        return []
+    blog = read_exports(blog_path)
+    posts = [blog["featuredArticle"]] if "featuredArticle" in blog else []
+    posts.extend(blog.get("blogPosts", []))
+    return posts
+
+def iter_documents(tool_records, game_records, posts):
+    """Yield ((type, id, title, path), tokens) for every searchable entry"""
+    for post in posts:
+        yield ("blog", post["slug"], post["title"], f"/blog/{post['slug']}"), tokenize(
+            post["title"], post["description"], post.get("author", ""), post.get("category", ""),
+            *post.get("tags", []))
+
+    for kind, records in (("tool", tool_records), ("game", game_records)):
+        for record in records:
+            metadata = record["metadata"]
+            path = metadata["url"][len(seo_optimization.SITE_URL):]
+            yield (kind, record["id"], record["name"], path), tokenize(
+                record["name"], record.get("category", ""), metadata["title"], metadata["description"],
+                metadata["keywords"])
+
+def build_search_index(documents):
+    """Return the index dict for (doc, tokens) pairs"""
+    docs = []
+    postings = {}
+    for number, (doc, tokens) in enumerate(documents):
+        docs.append(list(doc))
+        for token in tokens:
+            postings.setdefault(token, []).append(number)
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        previous = 0
+        deltas = []
+        for number in postings[term]:
+            deltas.append(number - previous)
+            previous = number
+        encoded.append(deltas)
+    return {"version": SEARCH_INDEX_VERSION, "docs": docs, "terms": terms, "postings": encoded}
+
+def write_search_index(path=SEARCH_INDEX_FILE, tool_records=None, game_records=None, blog_path=BLOG_DATA,
+                       stats=None):
+    """Rebuild the search index artifact, returning True if the file changed"""
+    with instrumentation.stage("search_index"):
+        if stats is None:
+            stats = {}
+        if tool_records is None:
+            tool_records = seo_optimization.iter_tool_metadata()
+        if game_records is None:
+            game_records = seo_optimization.iter_game_metadata()
+
+        index = build_search_index(iter_documents(tool_records, game_records, load_posts(blog_path)))
+        data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        stats["docs"] = len(index["docs"])
+        stats["terms"] = len(index["terms"])
+        stats["bytes"] = len(data)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(data)
+        changed = seo_optimization.replace_if_changed(f"{path}.tmp", path)
+        instrumentation.add("docs", stats["docs"])
+        instrumentation.add("terms", stats["terms"])
+        return changed
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the client search index for tools, games and blog posts")
+    parser.add_argument("--output", default=SEARCH_INDEX_FILE, help=f"index file (default: {SEARCH_INDEX_FILE})")
+    parser.add_argument("--blog-data", default=BLOG_DATA, help=f"blog posts module (default: {BLOG_DATA})")
+    args = parser.parse_args()
+
+    stats = {}
+    changed = write_search_index(args.output, blog_path=args.blog_data, stats=stats)
+    print(f"{'Wrote' if changed else 'Unchanged'} {args.output}: {stats['docs']} documents, "
+          f"{stats['terms']} terms, {stats['bytes']} bytes")
+
+if __name__ == "__main__":
+    main()
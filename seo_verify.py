@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Verify that every sitemap URL resolves on a locally served site.
+
+Streams <loc> entries out of one or more sitemaps (plain or gzipped, sitemap
+indexes are followed to their local shards) and requests each URL's path
+from a local server. Requests run on a fixed pool of keep-alive connections,
+so concurrency stays bounded however long the sitemap is. Results are grouped
+by route (e.g. /tools/*/*) with status counts and latency percentiles, and
+every URL that did not answer 2xx is listed.
+
+Point it at a running server with --base-url (e.g. `npm run preview`), or
+pass --serve dist to have it serve a static build itself. The built-in server
+has no single-page-app fallback, so a URL only resolves if the build holds a
+page for it (see seo_prerender). URLs are compared by path, since sitemaps
+may name different hosts; when several sitemaps are given, paths that only
+some of them list are reported as well.
+
+    python seo_verify.py --serve dist public/sitemap.xml
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import mimetypes
+import os
+import ssl
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from urllib.parse import unquote, urlsplit
+
+SITEMAP_FILE = "public/sitemap.xml"
+
+CONCURRENCY = 32
+TIMEOUT = 10.0
+
+PERCENTILES = (50, 90, 99)
+
+# Failing URLs printed; the JSON report lists all of them
+FAILURE_LIMIT = 50
+
+def open_sitemap(path):
+    """Open a sitemap for binary reading, decompressing .gz files"""
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+def iter_sitemap_urls(path):
+    """Stream <loc> values from a sitemap, following a sitemap index to its local shards.
+
+    Shards are looked up next to the index by file name, since their <loc>
+    points at the deployed site.
+    """
+    loc = None
+    with open_sitemap(path) as f:
+        for _, element in ET.iterparse(f, events=("end",)):
+            tag = element.tag.rsplit("}", 1)[-1]
+            if tag == "loc":
+                loc = (element.text or "").strip()
+            elif tag == "url":
+                yield loc
+                element.clear()
+            elif tag == "sitemap":
+                shard = os.path.join(os.path.dirname(path), os.path.basename(urlsplit(loc).path))
+                yield from iter_sitemap_urls(shard)
+                element.clear()
+
+def route_pattern(path):
+    """Group a path by its first segment, e.g. /tools/health/bmi-calculator -> /tools/*/*"""
+    parts = [part for part in path.split("/") if part]
+    if not parts:
+        return "/"
+    return "/" + "/".join([parts[0]] + ["*"] * (len(parts) - 1))
+
+def percentile(values, percent):
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[rank - 1]
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection, reopened when the server closes it"""
+
+    def __init__(self, host, port, use_ssl):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self.reader = None
+        self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, target):
+        """GET ``target`` and return the status code, draining the body"""
+        # A reused connection may have been closed by the server while idle;
+        # retry once on a fresh one in that case
+        for attempt in range(2):
+            reused = self.writer is not None
+            if not reused:
+                await self.open()
+            try:
+                self.writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}\r\n"
+                                  f"Connection: keep-alive\r\n\r\n".encode("latin-1"))
+                await self.writer.drain()
+                status, keep_alive = await self.read_response()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            if not keep_alive:
+                self.close()
+            return status
+
+    async def read_response(self):
+        """Read one response, returning (status, keep_alive)"""
+        status_line = await self.reader.readuntil(b"\r\n")
+        version, status = status_line.split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == b"HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        status = int(status)
+        if status in (204, 304) or 100 <= status < 200:
+            pass
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif "content-length" in headers:
+            await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            await self.reader.read()
+            keep_alive = False
+        return status, keep_alive
+
+async def check_urls(queue, base, results, timeout):
+    """Worker: request queued URLs over one connection until a None arrives"""
+    connection = Connection(base.hostname, base.port or (443 if base.scheme == "https" else 80),
+                            base.scheme == "https")
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            loc, target = item
+            start = time.perf_counter()
+            try:
+                status, error = await asyncio.wait_for(connection.request(target), timeout), None
+            except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                connection.close()
+                status, error = None, str(e) or type(e).__name__
+            results.append((loc, target, status, time.perf_counter() - start, error))
+    finally:
+        connection.close()
+
+async def serve_file(root, reader, writer):
+    """Serve files under ``root`` over keep-alive HTTP/1.1 with no SPA fallback"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            method, target = request_line.decode("latin-1").split()[:2]
+            path = os.path.normpath(os.path.join(root, unquote(urlsplit(target).path).lstrip("/")))
+            body, status, content_type = b"Not Found", "404 Not Found", "text/plain"
+            if os.path.commonpath([root, path]) == root:
+                if os.path.isdir(path):
+                    path = os.path.join(path, "index.html")
+                if os.path.isfile(path):
+                    with open(path, "rb") as f:
+                        body = f.read()
+                    status = "200 OK"
+                    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1"))
+            if method != "HEAD":
+                writer.write(body)
+            await writer.drain()
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def verify(sitemaps, base_url=None, serve_dir=None, concurrency=CONCURRENCY, timeout=TIMEOUT):
+    """Check every URL in ``sitemaps`` and return (results, sources).
+
+    ``results`` holds (loc, path, status, seconds, error) per distinct path;
+    ``sources`` maps each path to the indexes of the sitemaps listing it.
+    """
+    server = None
+    if serve_dir is not None:
+        root = os.path.abspath(serve_dir)
+        server = await asyncio.start_server(lambda r, w: serve_file(root, r, w), "127.0.0.1", 0)
+        base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    base = urlsplit(base_url)
+    queue = asyncio.Queue(maxsize=concurrency * 4)
+    results = []
+    sources = {}
+    workers = [asyncio.create_task(check_urls(queue, base, results, timeout)) for _ in range(max(1, concurrency))]
+    try:
+        for number, sitemap in enumerate(sitemaps):
+            for loc in iter_sitemap_urls(sitemap):
+                url = urlsplit(loc)
+                target = (url.path or "/") + (f"?{url.query}" if url.query else "")
+                if target in sources:
+                    sources[target].add(number)
+                    continue
+                sources[target] = {number}
+                await queue.put((loc, target))
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    return results, sources
+
+def summarize_routes(results):
+    """Return {pattern: stats} with status counts and latency percentiles in ms"""
+    groups = {}
+    for _, path, status, seconds, _ in results:
+        group = groups.setdefault(route_pattern(path), {"statuses": Counter(), "latencies": []})
+        group["statuses"][str(status) if status is not None else "error"] += 1
+        group["latencies"].append(seconds * 1000)
+
+    summary = {}
+    for pattern in sorted(groups):
+        latencies = sorted(groups[pattern]["latencies"])
+        summary[pattern] = {
+            "urls": len(latencies),
+            "statuses": dict(groups[pattern]["statuses"]),
+            **{f"p{percent}_ms": round(percentile(latencies, percent), 2) for percent in PERCENTILES}
+        }
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that every sitemap URL resolves on a local server")
+    parser.add_argument("sitemaps", nargs="*", default=[SITEMAP_FILE],
+                        help=f"sitemap or sitemap index files, optionally .gz (default: {SITEMAP_FILE})")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="running server to check against, e.g. http://localhost:4173")
+    target.add_argument("--serve", metavar="BUILD_DIR", help="serve this static build locally and check against it")
+    parser.add_argument("--concurrency", "-c", type=int, default=CONCURRENCY,
+                        help=f"pooled connections / requests in flight (default: {CONCURRENCY})")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT, help=f"seconds per request (default: {TIMEOUT})")
+    parser.add_argument("--output", help="also write the per-route stats and failures as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results, sources = asyncio.run(verify(args.sitemaps, args.base_url, args.serve, args.concurrency, args.timeout))
+    elapsed = time.perf_counter() - start
+
+    routes = summarize_routes(results)
+    failures = [
+        {"url": loc, "status": status, "error": error}
+        for loc, _, status, _, error in results
+        if status is None or not 200 <= status < 300
+    ]
+    partial = {path: sorted(numbers) for path, numbers in sources.items() if len(numbers) < len(args.sitemaps)}
+
+    print(f"{'Route':<24} {'URLs':>6}  {'Statuses':<24} " + " ".join(f"{'p' + str(p):>8}" for p in PERCENTILES))
+    for pattern, stats in routes.items():
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(stats["statuses"].items()))
+        print(f"{pattern:<24} {stats['urls']:>6}  {statuses:<24} "
+              + " ".join(f"{stats[f'p{p}_ms']:>6.1f}ms" for p in PERCENTILES))
+
+    for failure in failures[:FAILURE_LIMIT]:
+        print(f"FAIL {failure['status'] or failure['error']}  {failure['url']}")
+    if len(failures) > FAILURE_LIMIT:
+        print(f"... and {len(failures) - FAILURE_LIMIT} more")
+    for number, sitemap in enumerate(args.sitemaps):
+        missing = sum(1 for numbers in partial.values() if number not in numbers)
+        if missing:
+            print(f"{sitemap} is missing {missing} paths listed by the other sitemaps")
+
+    rate = len(results) / elapsed if elapsed else 0
+    print(f"\nChecked {len(results)} URLs in {elapsed:.2f}s ({rate:.0f}/s): {len(failures)} failed")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"routes": routes, "failures": failures,
+                       "partial": {path: [args.sitemaps[n] for n in numbers] for path, numbers in partial.items()}},
+                      f, indent=2)
+            f.write("\n")
+        print(f"Report written to {args.output}")
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
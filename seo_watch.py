@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the Edurance Hub SEO pipeline.
+
+Runs the full pipeline once, then polls the catalog (seo_optimization.py: the
+TOOLS/GAMES data and the title, description and keyword templates), the
+generated metadata JSON and src/components/tools. When the catalog changes
+every record is rebuilt, but only the components whose records actually
+changed are re-patched. The lazy route manifest is regenerated when the
+catalog or component mapping changes, and the sitemap is rewritten only when
+a URL is added or removed or its content-derived lastmod moves (unchanged
+shards are left alone). Polling with os.stat is used rather than inotify so
+the watcher has no platform-specific dependencies.
+"""
+
+import argparse
+import importlib
+import os
+import time
+
+import add_seo_to_components
+import component_index
+import route_manifest
+import seo_lastmod
+import seo_optimization
+
+CATALOG_FILE = seo_optimization.__file__
+
+METADATA_FILES = [add_seo_to_components.TOOL_METADATA_JSON, add_seo_to_components.GAME_METADATA_JSON]
+
+def file_stat(path):
+    """Return (mtime_ns, size) for a path, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def snapshot_components(component_dir=component_index.COMPONENT_DIR, router_files=component_index.ROUTER_FILES):
+    """Stat every file the component index covers"""
+    stats = {}
+    if os.path.isdir(component_dir):
+        with os.scandir(component_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".tsx"):
+                    st = entry.stat()
+                    stats[f"{component_dir}/{entry.name}"] = (st.st_mtime_ns, st.st_size)
+    for path in router_files:
+        stat = file_stat(path)
+        if stat is not None:
+            stats[path] = stat
+    return stats
+
+def catalog_entries(module):
+    """Map ("tool"|"game", id) to the raw catalog entry and its category"""
+    entries = {}
+    for category, tools in module.TOOLS.items():
+        for tool in tools:
+            entries[("tool", tool["id"])] = (category, dict(tool))
+    for game in module.GAMES:
+        entries[("game", game["id"])] = (None, dict(game))
+    return entries
+
+def build_record(module, key, value):
+    """Build the metadata record for one catalog entry"""
+    category, entry = value
+    if key[0] == "tool":
+        return module.build_tool_record(category, entry)
+    return module.build_game_record(entry)
+
+def records_from_artifacts():
+    """Read records back from the metadata JSON, keyed like catalog_entries"""
+    records = {}
+    for tool in add_seo_to_components.iter_tool_records():
+        records[("tool", tool["id"])] = tool
+    for game in add_seo_to_components.iter_game_records():
+        records[("game", game["id"])] = game
+    return records
+
+def diff_keys(old, new):
+    """Return keys that were added, changed or removed between two dicts"""
+    changed = {key for key, value in new.items() if old.get(key) != value}
+    removed = set(old) - set(new)
+    return changed, removed
+
+def save_artifacts(state):
+    """Write the metadata JSON from the in-memory records and remember its stats"""
+    module = state["module"]
+    tool_metadata = {category: [] for category in module.TOOLS}
+    game_metadata = []
+    for key in state["entries"]:
+        record = dict(state["records"][key])
+        if key[0] == "tool":
+            tool_metadata[record.pop("category")].append(record)
+        else:
+            game_metadata.append(record)
+
+    module.save_metadata_to_file(tool_metadata, game_metadata)
+    state["metadata_stats"] = {path: file_stat(path) for path in METADATA_FILES}
+
+def state_records(state, kind):
+    """Return the in-memory records of one kind ("tool" or "game") in catalog order"""
+    return [state["records"][key] for key in state["entries"] if key[0] == kind]
+
+def write_manifest(state):
+    """Regenerate the route manifest, returning True if it changed"""
+    changed = route_manifest.write_route_manifest(index=state["index"], tool_records=state_records(state, "tool"),
+                                                  game_records=state_records(state, "game"))
+    if changed:
+        # Our own write should not look like an edit on the next poll
+        state["component_stats"] = snapshot_components()
+    return changed
+
+def update_lastmod(state):
+    """Refresh the lastmod manifest, returning True if any URL's date or the URL set changed"""
+    lastmods = seo_lastmod.build_lastmod(state["lastmod_file"], state["index"],
+                                         tool_records=state_records(state, "tool"),
+                                         game_records=state_records(state, "game"))
+    changed = lastmods != state.get("lastmods")
+    state["lastmods"] = lastmods
+    return changed
+
+def write_sitemap(state):
+    """Regenerate the sitemap, rewriting only shards whose bytes changed"""
+    module = state["module"]
+    stats = {}
+    module.write_sitemap(module.generate_sitemap_entries(state["lastmods"]), state["sitemap_dir"],
+                         compress=state["compress"], stats=stats)
+    return stats["shards_written"]
+
+def patch_keys(state, keys):
+    """Re-patch the components that the given record keys resolve to"""
+    routes = state["index"]["routes"]
+    tasks = []
+    for key in sorted(keys):
+        record = state["records"].get(key)
+        path = routes.get(key[1])
+        if record is None or path is None:
+            continue
+        inject = add_seo_to_components.inject_tool_seo if key[0] == "tool" else add_seo_to_components.inject_game_seo
+        tasks.append((path, record["metadata"], inject))
+
+    count = add_seo_to_components.run_tasks(tasks, state["cache"], state["stats"])
+    if count:
+        add_seo_to_components.save_cache(state["cache"], state["cache_file"])
+        # Our own writes should not look like edits on the next poll
+        state["component_stats"] = snapshot_components()
+    return count
+
+def reload_catalog(state):
+    """Re-import the catalog, rebuild every record and return the keys whose records changed.
+
+    Built records are compared rather than raw entries, so edits to the
+    templates (tool_title, CATEGORY_KEYWORDS, ...) are picked up as well.
+    """
+    module = importlib.reload(state["module"])
+    state["module"] = module
+    entries = catalog_entries(module)
+    records = {key: build_record(module, key, value) for key, value in entries.items()}
+    changed, removed = diff_keys(state["records"], records)
+
+    state["records"] = records
+    state["entries"] = entries
+    return changed, removed
+
+def initial_build(sitemap_dir="public", compress=False, cache_file=add_seo_to_components.CACHE_FILE,
+                  index_file=component_index.INDEX_FILE, lastmod_file=seo_lastmod.LASTMOD_FILE):
+    """Run the whole pipeline once and return the state the watcher diffs against"""
+    module = seo_optimization
+    entries = catalog_entries(module)
+    state = {
+        "module": module,
+        "entries": entries,
+        "records": {key: build_record(module, key, value) for key, value in entries.items()},
+        "sitemap_dir": sitemap_dir,
+        "compress": compress,
+        "cache_file": cache_file,
+        "index_file": index_file,
+        "lastmod_file": lastmod_file,
+        "cache": add_seo_to_components.load_cache(cache_file),
+        "stats": add_seo_to_components.new_stats(),
+        "catalog_stat": file_stat(CATALOG_FILE)
+    }
+    state["index"] = component_index.build_component_index(index_file)
+    state["component_stats"] = snapshot_components()
+
+    save_artifacts(state)
+    write_manifest(state)
+    patch_keys(state, state["records"].keys())
+    update_lastmod(state)
+    write_sitemap(state)
+    return state
+
+def poll(state):
+    """Check every watched input once and apply the minimal update.
+
+    Returns a summary dict of what was done, or None if nothing changed.
+    """
+    summary = {"records": 0, "components": 0, "shards": 0}
+    dirty = set()
+
+    # Catalog edits: rebuild changed records and rewrite artifacts
+    catalog_stat = file_stat(CATALOG_FILE)
+    if catalog_stat != state["catalog_stat"]:
+        state["catalog_stat"] = catalog_stat
+        try:
+            changed, removed = reload_catalog(state)
+        except Exception as e:
+            # Usually a half-saved edit; keep the last good catalog
+            print(f"Could not reload catalog: {str(e)}")
+        else:
+            if changed or removed:
+                save_artifacts(state)
+                summary["records"] += len(changed) + len(removed)
+                dirty |= changed
+                write_manifest(state)
+
+    # Hand edits to the metadata JSON: patch from the edited records
+    metadata_stats = {path: file_stat(path) for path in METADATA_FILES}
+    if metadata_stats != state["metadata_stats"]:
+        state["metadata_stats"] = metadata_stats
+        try:
+            records = records_from_artifacts()
+        except (OSError, ValueError) as e:
+            print(f"Could not read metadata: {str(e)}")
+        else:
+            # JSON tool records are grouped by category rather than carrying
+            # it, so compare (and take over) just the metadata
+            changed = {key for key, record in records.items()
+                       if key in state["records"] and state["records"][key]["metadata"] != record["metadata"]}
+            for key in changed:
+                state["records"][key] = dict(state["records"][key], metadata=records[key]["metadata"])
+            summary["records"] += len(changed)
+            dirty |= changed
+
+    # Component edits: re-index changed files and re-patch what they serve
+    component_stats = snapshot_components()
+    if component_stats != state["component_stats"]:
+        edited = {path for path, stat in component_stats.items() if state["component_stats"].get(path) != stat}
+        state["component_stats"] = component_stats
+        old_routes = state["index"]["routes"]
+        state["index"] = component_index.build_component_index(state["index_file"])
+        routes = state["index"]["routes"]
+        for key in state["records"]:
+            path = routes.get(key[1])
+            if path is not None and (path in edited or old_routes.get(key[1]) != path):
+                dirty.add(key)
+        if routes != old_routes:
+            write_manifest(state)
+
+    if dirty:
+        summary["components"] += patch_keys(state, dirty)
+
+    # Only new/removed URLs or moved lastmod dates change the sitemap
+    if (summary["records"] or dirty) and update_lastmod(state):
+        summary["shards"] += write_sitemap(state)
+
+    if not any(summary.values()):
+        return None
+    return summary
+
+def watch(interval=0.25, sitemap_dir="public", compress=False, cache_file=add_seo_to_components.CACHE_FILE,
+          index_file=component_index.INDEX_FILE, lastmod_file=seo_lastmod.LASTMOD_FILE):
+    """Build once, then poll for changes until interrupted"""
+    print("Running initial build...")
+    state = initial_build(sitemap_dir, compress, cache_file, index_file, lastmod_file)
+    print(f"\nWatching {os.path.basename(CATALOG_FILE)}, metadata JSON and {component_index.COMPONENT_DIR} "
+          f"(every {interval}s, Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            start = time.perf_counter()
+            summary = poll(state)
+            if summary is not None:
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"Updated {summary['records']} records, {summary['components']} components, "
+                      f"{summary['shards']} sitemap files in {elapsed:.1f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally regenerate SEO metadata, sitemap and component heads on change")
+    parser.add_argument("--interval", type=float, default=0.25, help="seconds between polls (default: 0.25)")
+    parser.add_argument("--sitemap-dir", default="public", help="directory to write sitemap files to (default: public)")
+    parser.add_argument("--gzip", action="store_true", help="write gzip-compressed sitemap shards behind a sitemap index")
+    parser.add_argument("--cache-file", default=add_seo_to_components.CACHE_FILE,
+                        help=f"component cache manifest (default: {add_seo_to_components.CACHE_FILE})")
+    parser.add_argument("--index-file", default=component_index.INDEX_FILE,
+                        help=f"component index (default: {component_index.INDEX_FILE})")
+    parser.add_argument("--lastmod-file", default=seo_lastmod.LASTMOD_FILE,
+                        help=f"manifest of content-derived lastmod dates (default: {seo_lastmod.LASTMOD_FILE})")
+    args = parser.parse_args()
+
+    watch(args.interval, args.sitemap_dir, args.gzip, args.cache_file, args.index_file, args.lastmod_file)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Droplets, Activity, Thermometer, User } from 'lucide-react';
 // Removed Helmet import since SEO is handled by ToolDetail component
+// seo:helmet-delegated
 
 const WaterIntakeCalculator = () => {
   const seo = {
@@ -0,0 +1,114 @@
+// Client for the prebuilt search index written by seo_search_index.py to
+// public/search-index.json. The index is fetched once and queried in memory:
+// each query token is a binary search over the sorted terms for the range it
+// prefixes, and the matching postings are intersected across tokens.
+
+export const SEARCH_INDEX_VERSION = 1;
+
+export type SearchDocType = 'tool' | 'game' | 'blog';
+
+export interface SearchDoc {
+  type: SearchDocType;
+  id: string;
+  title: string;
+  path: string;
+}
+
+interface SearchIndexData {
+  version: number;
+  docs: [SearchDocType, string, string, string][];
+  terms: string[];
+  postings: number[][];
+}
+
+export interface SearchIndex {
+  docs: SearchDoc[];
+  terms: string[];
+  postings: number[][];
+  decoded: (number[] | undefined)[];
+}
+
+let pending: Promise<SearchIndex | null> | null = null;
+
+// Must match TOKEN in seo_search_index.py
+export const tokenize = (text: string): string[] => text.toLowerCase().match(/[a-z0-9]+/g) ?? [];
+
+// Match unindexed text the way searchIndex does: every query token must start
+// one of its tokens
+export const matchesQuery = (texts: string[], query: string): boolean => {
+  const terms = tokenize(texts.join(' '));
+  return tokenize(query).every(token => terms.some(term => term.startsWith(token)));
+};
+
+export const loadSearchIndex = (url: string = '/search-index.json'): Promise<SearchIndex | null> => {
+  if (!pending) {
+    pending = fetch(url)
+      .then(response => (response.ok ? response.json() : null))
+      .then((data: SearchIndexData | null) => {
+        if (!data || data.version !== SEARCH_INDEX_VERSION) return null;
+        return {
+          docs: data.docs.map(([type, id, title, path]) => ({ type, id, title, path })),
+          terms: data.terms,
+          postings: data.postings,
+          decoded: new Array(data.terms.length)
+        };
+      })
+      .catch(error => {
+        console.error('Error loading search index:', error);
+        return null;
+      });
+  }
+  return pending;
+};
+
+const postingsFor = (index: SearchIndex, term: number): number[] => {
+  let docs = index.decoded[term];
+  if (!docs) {
+    docs = [];
+    let number = 0;
+    for (const delta of index.postings[term]) {
+      number += delta;
+      docs.push(number);
+    }
+    index.decoded[term] = docs;
+  }
+  return docs;
+};
+
+const lowerBound = (terms: string[], prefix: string): number => {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (terms[mid] < prefix) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+const matchPrefix = (index: SearchIndex, prefix: string): Set<number> => {
+  const matches = new Set<number>();
+  for (let term = lowerBound(index.terms, prefix); term < index.terms.length && index.terms[term].startsWith(prefix); term++) {
+    for (const doc of postingsFor(index, term)) matches.add(doc);
+  }
+  return matches;
+};
+
+// Return the documents containing a term starting with every query token, in
+// index order, optionally limited to one type
+export const searchIndex = (index: SearchIndex, query: string, type?: SearchDocType): SearchDoc[] => {
+  const tokens = Array.from(new Set(tokenize(query))).sort((a, b) => b.length - a.length);
+  if (tokens.length === 0) return [];
+
+  let matches: Set<number> | null = null;
+  for (const token of tokens) {
+    const found = matchPrefix(index, token);
+    matches = matches ? new Set(Array.from(matches).filter(doc => found.has(doc))) : found;
+    if (matches.size === 0) return [];
+  }
+
+  return Array.from(matches!)
+    .sort((a, b) => a - b)
+    .map(doc => index.docs[doc])
+    .filter(doc => !type || doc.type === type);
+};
@@ -0,0 +1,457 @@
+// Generated by route_manifest.py from the SEO catalog. Do not edit by hand;
+// run `python route_manifest.py` (or the SEO pipeline) after changing tools or games.
+import { lazy, type ComponentType, type LazyExoticComponent } from 'react';
+
+export interface RouteEntry {
+  id: string;
+  name: string;
+  category?: string;
+  title: string;
+  description: string;
+  keywords: string;
+  url: string;
+  component: LazyExoticComponent<ComponentType>;
+}
+
+const toolLoaders = {
+  'water-intake': () => import('../components/tools/WaterIntakeCalculator'),
+  'food-calories': () => import('../components/tools/FoodCaloriesCalculator'),
+  'calories-burn': () => import('../components/tools/CaloriesBurnCalculator'),
+  'body-fat': () => import('../components/tools/BodyFatCalculator'),
+  'bmi-calculator': () => import('../components/tools/BMICalculator'),
+  'gst-calculator': () => import('../components/tools/GSTCalculator'),
+  'electricity-bill': () => import('../components/tools/ElectricityBillCalculator'),
+  'simple-interest': () => import('../components/tools/SimpleInterestCalculator'),
+  'compound-interest': () => import('../components/tools/CompoundInterestCalculator'),
+  'percentage-calculator': () => import('../components/tools/PercentageCalculator'),
+  'loan-emi': () => import('../components/tools/LoanEMICalculator'),
+  'currency-converter': () => import('../components/tools/CurrencyConverter'),
+  'salary-satisfaction': () => import('../components/tools/SalarySatisfactionCalculator'),
+  'unit-converter': () => import('../components/tools/UnitConverter'),
+  'percentage-cgpa': () => import('../components/tools/PercentageToCGPA'),
+  'timezone-converter': () => import('../components/tools/TimezoneConverter'),
+  'profession-finder': () => import('../components/tools/ProfessionFinder'),
+  'exam-survival': () => import('../components/tools/ExamSurvivalProbability'),
+  'love-percentage': () => import('../components/tools/LovePercentage'),
+  'friendship-calculator': () => import('../components/tools/FriendshipCalculator'),
+  'breakup-probability': () => import('../components/tools/BreakupProbability'),
+  'cheating-suspicion': () => import('../components/tools/CheatingSuspicion'),
+  'best-friend-loyalty': () => import('../components/tools/BestFriendLoyalty'),
+  'divorce-outcome': () => import('../components/tools/DivorceOutcome'),
+  'gold-digger': () => import('../components/tools/GoldDigger'),
+  'password-strength': () => import('../components/tools/PasswordStrengthChecker'),
+  'character-checker': () => import('../components/tools/CharacterChecker'),
+  'sex-ride-tonight': () => import('../components/tools/SexRideTonight'),
+  'dowry-calculator': () => import('../components/tools/DowryCalculator'),
+  'pet-affection': () => import('../components/tools/PetAffectionCalculator'),
+  'laziness-calculator': () => import('../components/tools/LazinessCalculator'),
+};
+
+const gameLoaders = {
+  'math-roast': () => import('../components/tools/MathRoastGame'),
+  'typing-speed': () => import('../components/tools/TypingSpeedTest'),
+  'tic-tac-toe': () => import('../components/tools/TicTacToe'),
+  'rock-paper-scissors': () => import('../components/tools/RockPaperScissors'),
+  'snake': () => import('../components/tools/SnakeGame'),
+  'memory-flip': () => import('../components/tools/MemoryFlipGame'),
+  'word-scramble': () => import('../components/tools/WordScramble'),
+  'pong-2d': () => import('../components/tools/Pong2D'),
+  'hangman': () => import('../components/tools/HangmanGame'),
+};
+
+export const toolRoutes: Record<string, RouteEntry> = {
+  'water-intake': {
+    id: "water-intake",
+    name: "Water Intake Calculator",
+    category: "health",
+    title: "Free Water Intake Calculator Online | Calculate your daily water intake needs based on your weight, activity level, and climate | Edurance Hub",
+    description: "Free online water intake calculator - Calculate your daily water intake needs based on your weight, activity level, and climate. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of health tools.",
+    keywords: "water intake calculator, free water intake calculator, online water intake calculator, water intake calculator calculator, health, health tools, free calculator, online tool, edurance hub, health calculator, fitness tool, wellness calculator",
+    url: "https://edurancehub.com/tools/health/water-intake",
+    component: lazy(toolLoaders['water-intake'])
+  },
+  'food-calories': {
+    id: "food-calories",
+    name: "Food Calories Calculator",
+    category: "health",
+    title: "Free Food Calories Calculator Online | Track and calculate calories in your meals for better nutrition management | Edurance Hub",
+    description: "Free online food calories calculator - Track and calculate calories in your meals for better nutrition management. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of health tools.",
+    keywords: "food calories calculator, free food calories calculator, online food calories calculator, food calories calculator calculator, health, health tools, free calculator, online tool, edurance hub, health calculator, fitness tool, wellness calculator",
+    url: "https://edurancehub.com/tools/health/food-calories",
+    component: lazy(toolLoaders['food-calories'])
+  },
+  'calories-burn': {
+    id: "calories-burn",
+    name: "Calories Burn Calculator",
+    category: "health",
+    title: "Free Calories Burn Calculator Online | Calculate calories burned during various activities and exercises | Edurance Hub",
+    description: "Free online calories burn calculator - Calculate calories burned during various activities and exercises. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of health tools.",
+    keywords: "calories burn calculator, free calories burn calculator, online calories burn calculator, calories burn calculator calculator, health, health tools, free calculator, online tool, edurance hub, health calculator, fitness tool, wellness calculator",
+    url: "https://edurancehub.com/tools/health/calories-burn",
+    component: lazy(toolLoaders['calories-burn'])
+  },
+  'body-fat': {
+    id: "body-fat",
+    name: "Body Fat Calculator",
+    category: "health",
+    title: "Free Body Fat Calculator Online | Calculate your body fat percentage using advanced measurement techniques | Edurance Hub",
+    description: "Free online body fat calculator - Calculate your body fat percentage using advanced measurement techniques. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of health tools.",
+    keywords: "body fat calculator, free body fat calculator, online body fat calculator, body fat calculator calculator, health, health tools, free calculator, online tool, edurance hub, health calculator, fitness tool, wellness calculator",
+    url: "https://edurancehub.com/tools/health/body-fat",
+    component: lazy(toolLoaders['body-fat'])
+  },
+  'bmi-calculator': {
+    id: "bmi-calculator",
+    name: "BMI Calculator",
+    category: "health",
+    title: "Free BMI Calculator Online | Calculate your Body Mass Index to assess if you're at a healthy weight | Edurance Hub",
+    description: "Free online bmi calculator - Calculate your Body Mass Index to assess if you're at a healthy weight. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of health tools.",
+    keywords: "bmi calculator, free bmi calculator, online bmi calculator, bmi calculator calculator, health, health tools, free calculator, online tool, edurance hub, health calculator, fitness tool, wellness calculator",
+    url: "https://edurancehub.com/tools/health/bmi-calculator",
+    component: lazy(toolLoaders['bmi-calculator'])
+  },
+  'gst-calculator': {
+    id: "gst-calculator",
+    name: "GST Calculator",
+    category: "finance",
+    title: "Free GST Calculator Online | Calculate GST amounts for your purchases and business transactions | Edurance Hub",
+    description: "Free online gst calculator - Calculate GST amounts for your purchases and business transactions. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "gst calculator, free gst calculator, online gst calculator, gst calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/gst-calculator",
+    component: lazy(toolLoaders['gst-calculator'])
+  },
+  'electricity-bill': {
+    id: "electricity-bill",
+    name: "Electricity Bill Estimator",
+    category: "finance",
+    title: "Free Electricity Bill Estimator Online | Estimate your monthly electricity bill based on appliance usage | Edurance Hub",
+    description: "Free online electricity bill estimator - Estimate your monthly electricity bill based on appliance usage. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "electricity bill estimator, free electricity bill estimator, online electricity bill estimator, electricity bill estimator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/electricity-bill",
+    component: lazy(toolLoaders['electricity-bill'])
+  },
+  'simple-interest': {
+    id: "simple-interest",
+    name: "Simple Interest Calculator",
+    category: "finance",
+    title: "Free Simple Interest Calculator Online | Calculate simple interest on loans and investments | Edurance Hub",
+    description: "Free online simple interest calculator - Calculate simple interest on loans and investments. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "simple interest calculator, free simple interest calculator, online simple interest calculator, simple interest calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/simple-interest",
+    component: lazy(toolLoaders['simple-interest'])
+  },
+  'compound-interest': {
+    id: "compound-interest",
+    name: "Compound Interest Calculator",
+    category: "finance",
+    title: "Free Compound Interest Calculator Online | Calculate compound interest for savings and investment growth | Edurance Hub",
+    description: "Free online compound interest calculator - Calculate compound interest for savings and investment growth. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "compound interest calculator, free compound interest calculator, online compound interest calculator, compound interest calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/compound-interest",
+    component: lazy(toolLoaders['compound-interest'])
+  },
+  'percentage-calculator': {
+    id: "percentage-calculator",
+    name: "Percentage Calculator",
+    category: "finance",
+    title: "Free Percentage Calculator Online | Perform various percentage calculations quickly and accurately | Edurance Hub",
+    description: "Free online percentage calculator - Perform various percentage calculations quickly and accurately. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "percentage calculator, free percentage calculator, online percentage calculator, percentage calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/percentage-calculator",
+    component: lazy(toolLoaders['percentage-calculator'])
+  },
+  'loan-emi': {
+    id: "loan-emi",
+    name: "Loan EMI Calculator",
+    category: "finance",
+    title: "Free Loan EMI Calculator Online | Calculate your monthly loan EMIs with amortization schedule | Edurance Hub",
+    description: "Free online loan emi calculator - Calculate your monthly loan EMIs with amortization schedule. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "loan emi calculator, free loan emi calculator, online loan emi calculator, loan emi calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/loan-emi",
+    component: lazy(toolLoaders['loan-emi'])
+  },
+  'currency-converter': {
+    id: "currency-converter",
+    name: "Currency Converter",
+    category: "finance",
+    title: "Free Currency Converter Online | Convert between different currencies with real-time exchange rates | Edurance Hub",
+    description: "Free online currency converter - Convert between different currencies with real-time exchange rates. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "currency converter, free currency converter, online currency converter, currency converter calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/currency-converter",
+    component: lazy(toolLoaders['currency-converter'])
+  },
+  'salary-satisfaction': {
+    id: "salary-satisfaction",
+    name: "Salary Satisfaction Calculator",
+    category: "finance",
+    title: "Free Salary Satisfaction Calculator Online | Check your financial happiness based on your salary and lifestyle | Edurance Hub",
+    description: "Free online salary satisfaction calculator - Check your financial happiness based on your salary and lifestyle. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of finance tools.",
+    keywords: "salary satisfaction calculator, free salary satisfaction calculator, online salary satisfaction calculator, salary satisfaction calculator calculator, finance, finance tools, free calculator, online tool, edurance hub, financial calculator, money tool, finance calculator",
+    url: "https://edurancehub.com/tools/finance/salary-satisfaction",
+    component: lazy(toolLoaders['salary-satisfaction'])
+  },
+  'unit-converter': {
+    id: "unit-converter",
+    name: "Unit Converter",
+    category: "student",
+    title: "Free Unit Converter Online | Convert between different units of measurement quickly and accurately | Edurance Hub",
+    description: "Free online unit converter - Convert between different units of measurement quickly and accurately. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of student tools.",
+    keywords: "unit converter, free unit converter, online unit converter, unit converter calculator, student, student tools, free calculator, online tool, edurance hub, student tool, education calculator, academic tool",
+    url: "https://edurancehub.com/tools/student/unit-converter",
+    component: lazy(toolLoaders['unit-converter'])
+  },
+  'percentage-cgpa': {
+    id: "percentage-cgpa",
+    name: "Percentage to CGPA Converter",
+    category: "student",
+    title: "Free Percentage to CGPA Converter Online | Convert percentage scores to CGPA and vice versa for academic purposes | Edurance Hub",
+    description: "Free online percentage to cgpa converter - Convert percentage scores to CGPA and vice versa for academic purposes. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of student tools.",
+    keywords: "percentage to cgpa converter, free percentage to cgpa converter, online percentage to cgpa converter, percentage to cgpa converter calculator, student, student tools, free calculator, online tool, edurance hub, student tool, education calculator, academic tool",
+    url: "https://edurancehub.com/tools/student/percentage-cgpa",
+    component: lazy(toolLoaders['percentage-cgpa'])
+  },
+  'timezone-converter': {
+    id: "timezone-converter",
+    name: "Time Zone Converter",
+    category: "student",
+    title: "Free Time Zone Converter Online | Convert time between different time zones around the world | Edurance Hub",
+    description: "Free online time zone converter - Convert time between different time zones around the world. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of student tools.",
+    keywords: "time zone converter, free time zone converter, online time zone converter, time zone converter calculator, student, student tools, free calculator, online tool, edurance hub, student tool, education calculator, academic tool",
+    url: "https://edurancehub.com/tools/student/timezone-converter",
+    component: lazy(toolLoaders['timezone-converter'])
+  },
+  'profession-finder': {
+    id: "profession-finder",
+    name: "Career Path Finder",
+    category: "student",
+    title: "Free Career Path Finder Online | Discover your ideal career based on your interests and skills | Edurance Hub",
+    description: "Free online career path finder - Discover your ideal career based on your interests and skills. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of student tools.",
+    keywords: "career path finder, free career path finder, online career path finder, career path finder calculator, student, student tools, free calculator, online tool, edurance hub, student tool, education calculator, academic tool",
+    url: "https://edurancehub.com/tools/student/profession-finder",
+    component: lazy(toolLoaders['profession-finder'])
+  },
+  'exam-survival': {
+    id: "exam-survival",
+    name: "Exam Survival Probability",
+    category: "student",
+    title: "Free Exam Survival Probability Online | Predict your exam survival chances based on preparation level | Edurance Hub",
+    description: "Free online exam survival probability - Predict your exam survival chances based on preparation level. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of student tools.",
+    keywords: "exam survival probability, free exam survival probability, online exam survival probability, exam survival probability calculator, student, student tools, free calculator, online tool, edurance hub, student tool, education calculator, academic tool",
+    url: "https://edurancehub.com/tools/student/exam-survival",
+    component: lazy(toolLoaders['exam-survival'])
+  },
+  'love-percentage': {
+    id: "love-percentage",
+    name: "Love Percentage Calculator",
+    category: "relationship",
+    title: "Free Love Percentage Calculator Online | Calculate love compatibility between you and your partner | Edurance Hub",
+    description: "Free online love percentage calculator - Calculate love compatibility between you and your partner. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "love percentage calculator, free love percentage calculator, online love percentage calculator, love percentage calculator calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/love-percentage",
+    component: lazy(toolLoaders['love-percentage'])
+  },
+  'friendship-calculator': {
+    id: "friendship-calculator",
+    name: "Friendship Calculator",
+    category: "relationship",
+    title: "Free Friendship Calculator Online | Test the strength of your friendship with this fun calculator | Edurance Hub",
+    description: "Free online friendship calculator - Test the strength of your friendship with this fun calculator. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "friendship calculator, free friendship calculator, online friendship calculator, friendship calculator calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/friendship-calculator",
+    component: lazy(toolLoaders['friendship-calculator'])
+  },
+  'breakup-probability': {
+    id: "breakup-probability",
+    name: "Breakup Probability Calculator",
+    category: "relationship",
+    title: "Free Breakup Probability Calculator Online | Calculate the risk of breakup in your relationship | Edurance Hub",
+    description: "Free online breakup probability calculator - Calculate the risk of breakup in your relationship. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "breakup probability calculator, free breakup probability calculator, online breakup probability calculator, breakup probability calculator calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/breakup-probability",
+    component: lazy(toolLoaders['breakup-probability'])
+  },
+  'cheating-suspicion': {
+    id: "cheating-suspicion",
+    name: "Cheating Suspicion Score",
+    category: "relationship",
+    title: "Free Cheating Suspicion Score Online | Detect cheating suspicion level in your relationship | Edurance Hub",
+    description: "Free online cheating suspicion score - Detect cheating suspicion level in your relationship. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "cheating suspicion score, free cheating suspicion score, online cheating suspicion score, cheating suspicion score calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/cheating-suspicion",
+    component: lazy(toolLoaders['cheating-suspicion'])
+  },
+  'best-friend-loyalty': {
+    id: "best-friend-loyalty",
+    name: "Best Friend Loyalty Rating",
+    category: "relationship",
+    title: "Free Best Friend Loyalty Rating Online | Rate your bestie's loyalty with this entertaining calculator | Edurance Hub",
+    description: "Free online best friend loyalty rating - Rate your bestie's loyalty with this entertaining calculator. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "best friend loyalty rating, free best friend loyalty rating, online best friend loyalty rating, best friend loyalty rating calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/best-friend-loyalty",
+    component: lazy(toolLoaders['best-friend-loyalty'])
+  },
+  'divorce-outcome': {
+    id: "divorce-outcome",
+    name: "Divorce Outcome Calculator",
+    category: "relationship",
+    title: "Free Divorce Outcome Calculator Online | Predict divorce settlement results and outcomes | Edurance Hub",
+    description: "Free online divorce outcome calculator - Predict divorce settlement results and outcomes. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "divorce outcome calculator, free divorce outcome calculator, online divorce outcome calculator, divorce outcome calculator calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/divorce-outcome",
+    component: lazy(toolLoaders['divorce-outcome'])
+  },
+  'gold-digger': {
+    id: "gold-digger",
+    name: "Gold Digger Calculator",
+    category: "relationship",
+    title: "Free Gold Digger Calculator Online | Check if someone is with you for love or money | Edurance Hub",
+    description: "Free online gold digger calculator - Check if someone is with you for love or money. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of relationship tools.",
+    keywords: "gold digger calculator, free gold digger calculator, online gold digger calculator, gold digger calculator calculator, relationship, relationship tools, free calculator, online tool, edurance hub, relationship calculator, love tool, fun calculator",
+    url: "https://edurancehub.com/tools/relationship/gold-digger",
+    component: lazy(toolLoaders['gold-digger'])
+  },
+  'password-strength': {
+    id: "password-strength",
+    name: "Password Strength Checker",
+    category: "entertainment",
+    title: "Free Password Strength Checker Online | Check the security strength of your passwords | Edurance Hub",
+    description: "Free online password strength checker - Check the security strength of your passwords. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "password strength checker, free password strength checker, online password strength checker, password strength checker calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/password-strength",
+    component: lazy(toolLoaders['password-strength'])
+  },
+  'character-checker': {
+    id: "character-checker",
+    name: "Character Checker Tool",
+    category: "entertainment",
+    title: "Free Character Checker Tool Online | Discover your personality traits with this fun character quiz | Edurance Hub",
+    description: "Free online character checker tool - Discover your personality traits with this fun character quiz. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "character checker tool, free character checker tool, online character checker tool, character checker tool calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/character-checker",
+    component: lazy(toolLoaders['character-checker'])
+  },
+  'sex-ride-tonight': {
+    id: "sex-ride-tonight",
+    name: "Sex Ride Tonight Predictor",
+    category: "entertainment",
+    title: "Free Sex Ride Tonight Predictor Online | Predict tonight's passion level with your partner | Edurance Hub",
+    description: "Free online sex ride tonight predictor - Predict tonight's passion level with your partner. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "sex ride tonight predictor, free sex ride tonight predictor, online sex ride tonight predictor, sex ride tonight predictor calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/sex-ride-tonight",
+    component: lazy(toolLoaders['sex-ride-tonight'])
+  },
+  'dowry-calculator': {
+    id: "dowry-calculator",
+    name: "Dowry Calculator",
+    category: "entertainment",
+    title: "Free Dowry Calculator Online | Calculate groom's 'market value' in traditional terms | Edurance Hub",
+    description: "Free online dowry calculator - Calculate groom's 'market value' in traditional terms. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "dowry calculator, free dowry calculator, online dowry calculator, dowry calculator calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/dowry-calculator",
+    component: lazy(toolLoaders['dowry-calculator'])
+  },
+  'pet-affection': {
+    id: "pet-affection",
+    name: "Pet Affection Calculator",
+    category: "entertainment",
+    title: "Free Pet Affection Calculator Online | Measure your pet's love for you with this fun calculator | Edurance Hub",
+    description: "Free online pet affection calculator - Measure your pet's love for you with this fun calculator. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "pet affection calculator, free pet affection calculator, online pet affection calculator, pet affection calculator calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/pet-affection",
+    component: lazy(toolLoaders['pet-affection'])
+  },
+  'laziness-calculator': {
+    id: "laziness-calculator",
+    name: "Laziness Calculator",
+    category: "entertainment",
+    title: "Free Laziness Calculator Online | Discover your laziness level with this entertaining quiz | Edurance Hub",
+    description: "Free online laziness calculator - Discover your laziness level with this entertaining quiz. Quick, accurate, and easy to use. No signup required. Part of Edurance Hub's collection of entertainment tools.",
+    keywords: "laziness calculator, free laziness calculator, online laziness calculator, laziness calculator calculator, entertainment, entertainment tools, free calculator, online tool, edurance hub, fun tool, entertainment calculator, quiz tool",
+    url: "https://edurancehub.com/tools/entertainment/laziness-calculator",
+    component: lazy(toolLoaders['laziness-calculator'])
+  },
+};
+
+export const gameRoutes: Record<string, RouteEntry> = {
+  'math-roast': {
+    id: "math-roast",
+    name: "Math Roast Game",
+    title: "Play Math Roast Game Online Free | Solve math problems fast and get roasted for incorrect answers | Edurance Hub",
+    description: "Play Math Roast Game online for free. Solve math problems fast and get roasted for incorrect answers. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "math roast game, play math roast game online, free math roast game, online math roast game, free game, online game, edurance hub, solve game",
+    url: "https://edurancehub.com/games/math-roast",
+    component: lazy(gameLoaders['math-roast'])
+  },
+  'typing-speed': {
+    id: "typing-speed",
+    name: "Typing Speed Test",
+    title: "Play Typing Speed Test Online Free | Test your typing speed and accuracy with this challenging game | Edurance Hub",
+    description: "Play Typing Speed Test online for free. Test your typing speed and accuracy with this challenging game. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "typing speed test, play typing speed test online, free typing speed test, online typing speed test, free game, online game, edurance hub, test game",
+    url: "https://edurancehub.com/games/typing-speed",
+    component: lazy(gameLoaders['typing-speed'])
+  },
+  'tic-tac-toe': {
+    id: "tic-tac-toe",
+    name: "Tic Tac Toe",
+    title: "Play Tic Tac Toe Online Free | Classic X and O game with player vs player and computer modes | Edurance Hub",
+    description: "Play Tic Tac Toe online for free. Classic X and O game with player vs player and computer modes. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "tic tac toe, play tic tac toe online, free tic tac toe, online tic tac toe, free game, online game, edurance hub, classic game",
+    url: "https://edurancehub.com/games/tic-tac-toe",
+    component: lazy(gameLoaders['tic-tac-toe'])
+  },
+  'rock-paper-scissors': {
+    id: "rock-paper-scissors",
+    name: "Rock Paper Scissors",
+    title: "Play Rock Paper Scissors Online Free | Classic hand game of strategy and luck against computer | Edurance Hub",
+    description: "Play Rock Paper Scissors online for free. Classic hand game of strategy and luck against computer. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "rock paper scissors, play rock paper scissors online, free rock paper scissors, online rock paper scissors, free game, online game, edurance hub, classic game",
+    url: "https://edurancehub.com/games/rock-paper-scissors",
+    component: lazy(gameLoaders['rock-paper-scissors'])
+  },
+  'snake': {
+    id: "snake",
+    name: "Snake Game",
+    title: "Play Snake Game Online Free | Classic snake game with modern design and smooth controls | Edurance Hub",
+    description: "Play Snake Game online for free. Classic snake game with modern design and smooth controls. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "snake game, play snake game online, free snake game, online snake game, free game, online game, edurance hub, classic game",
+    url: "https://edurancehub.com/games/snake",
+    component: lazy(gameLoaders['snake'])
+  },
+  'memory-flip': {
+    id: "memory-flip",
+    name: "Memory Flip Game",
+    title: "Play Memory Flip Game Online Free | Test your memory with card matching challenges | Edurance Hub",
+    description: "Play Memory Flip Game online for free. Test your memory with card matching challenges. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "memory flip game, play memory flip game online, free memory flip game, online memory flip game, free game, online game, edurance hub, test game",
+    url: "https://edurancehub.com/games/memory-flip",
+    component: lazy(gameLoaders['memory-flip'])
+  },
+  'word-scramble': {
+    id: "word-scramble",
+    name: "Word Scramble",
+    title: "Play Word Scramble Online Free | Unscramble letters to form the correct words in this puzzle game | Edurance Hub",
+    description: "Play Word Scramble online for free. Unscramble letters to form the correct words in this puzzle game. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "word scramble, play word scramble online, free word scramble, online word scramble, free game, online game, edurance hub, unscramble game",
+    url: "https://edurancehub.com/games/word-scramble",
+    component: lazy(gameLoaders['word-scramble'])
+  },
+  'pong-2d': {
+    id: "pong-2d",
+    name: "Pong 2D",
+    title: "Play Pong 2D Online Free | Retro table tennis arcade game with modern enhancements | Edurance Hub",
+    description: "Play Pong 2D online for free. Retro table tennis arcade game with modern enhancements. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "pong 2d, play pong 2d online, free pong 2d, online pong 2d, free game, online game, edurance hub, retro game",
+    url: "https://edurancehub.com/games/pong-2d",
+    component: lazy(gameLoaders['pong-2d'])
+  },
+  'hangman': {
+    id: "hangman",
+    name: "Hangman Game",
+    title: "Play Hangman Game Online Free | Classic word guessing game with a twist and multiple categories | Edurance Hub",
+    description: "Play Hangman Game online for free. Classic word guessing game with a twist and multiple categories. Enjoy this fun game with modern design. No signup required. Part of Edurance Hub's collection of free online games.",
+    keywords: "hangman game, play hangman game online, free hangman game, online hangman game, free game, online game, edurance hub, classic game",
+    url: "https://edurancehub.com/games/hangman",
+    component: lazy(gameLoaders['hangman'])
+  },
+};
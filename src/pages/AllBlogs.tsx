@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo } from 'react';
 import { Link } from 'react-router-dom';
 import { 
   Calendar, 
@@ -15,6 +15,7 @@ import {
 import GlassCard from '../components/GlassCard';
 import { useTheme } from '../context/ThemeContext';
 import { getAllBlogPosts, type BlogPost } from '../data/blogData';
+import { loadSearchIndex, matchesQuery, searchIndex, tokenize, type SearchIndex } from '../data/searchIndex';
 
 const AllBlogs = () => {
   const { isDark } = useTheme();
@@ -25,8 +26,21 @@ const AllBlogs = () => {
   const [currentPage, setCurrentPage] = useState(1);
   const [viewMode, setViewMode] = useState<'grid' | 'list'>('grid');
   const [isRefreshing, setIsRefreshing] = useState(false);
+  const [index, setIndex] = useState<SearchIndex | null>(null);
   const postsPerPage = 12;
 
+  // Load the prebuilt search index once; until it arrives (or if it is
+  // missing) posts are matched by tokenizing their text the same way
+  useEffect(() => {
+    loadSearchIndex().then(setIndex);
+  }, []);
+
+  // Slugs covered by the index; admin-created posts are not and are scanned
+  const indexedSlugs = useMemo(
+    () => new Set(index ? index.docs.filter(doc => doc.type === 'blog').map(doc => doc.id) : []),
+    [index]
+  );
+
   // Load all blog posts
   useEffect(() => {
     const loadAllPosts = () => {
@@ -60,14 +74,18 @@ const AllBlogs = () => {
   useEffect(() => {
     let filtered = allPosts;
 
-    // Filter by search term
-    if (searchTerm) {
-      filtered = filtered.filter(post =>
-        post.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        post.description.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        post.author.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        post.tags.some(tag => tag.toLowerCase().includes(searchTerm.toLowerCase()))
-      );
+    // Filter by search term; a query without letters or digits matches everything
+    if (tokenize(searchTerm).length > 0) {
+      // Same fields as seo_search_index.py indexes for blog posts
+      const matchesText = (post: BlogPost) =>
+        matchesQuery([post.title, post.description, post.author, post.category, ...post.tags], searchTerm);
+
+      if (index) {
+        const hits = new Set(searchIndex(index, searchTerm, 'blog').map(doc => doc.id));
+        filtered = filtered.filter(post => (indexedSlugs.has(post.slug) ? hits.has(post.slug) : matchesText(post)));
+      } else {
+        filtered = filtered.filter(matchesText);
+      }
     }
 
     // Filter by category
@@ -77,7 +95,7 @@ const AllBlogs = () => {
 
     setFilteredPosts(filtered);
     setCurrentPage(1); // Reset to first page when filtering
-  }, [allPosts, searchTerm, selectedCategory]);
+  }, [allPosts, searchTerm, selectedCategory, index, indexedSlugs]);
 
   // Get unique categories
   const categories = Array.from(new Set(allPosts.map(post => post.category))).sort();
@@ -0,0 +1,100 @@
+from add_seo_to_components import HELMET_IMPORT, build_helmet_component, find_tag_end, inject_seo, scan_component
+
+METADATA = {"title": "Free Tool", "description": "A tool.", "keywords": "tool, free"}
+
+
+def test_fragment_root():
+    content = (
+        "import React from 'react';\n"
+        "\n"
+        "const Tool = () => {\n"
+        "  return (<>\n"
+        "    <p>Hi</p>\n"
+        "  </>);\n"
+        "};\n"
+    )
+    patched, status = inject_seo(content, METADATA)
+    assert status == "patched"
+    assert "return (<>\n" + build_helmet_component(METADATA) + "\n    <p>Hi</p>" in patched
+    assert patched.startswith("import React from 'react';\n" + HELMET_IMPORT + "\n")
+
+
+def test_tag_end_skips_arrow_functions_in_braces():
+    tag = '<div onClick={() => flip(card)} className={a > b ? "x" : "y"}>'
+    content = tag + "</div>"
+    assert find_tag_end(content, 0) == len(tag)
+    assert find_tag_end("<div />", 0) is None
+
+
+def test_root_ignores_nested_render_helpers():
+    content = (
+        "import React from 'react';\n"
+        "\n"
+        "const Game = () => {\n"
+        "  const renderCell = (cell) => {\n"
+        "    return (\n"
+        "      <div className=\"cell\">{cell}</div>\n"
+        "    );\n"
+        "  };\n"
+        "\n"
+        "  return (\n"
+        "    <div onClick={() => reset()}>\n"
+        "      {cells.map(renderCell)}\n"
+        "    </div>\n"
+        "  );\n"
+        "};\n"
+    )
+    root = scan_component(content)["root"]
+    assert content[:root].endswith("<div onClick={() => reset()}>")
+
+
+def test_delegated_helmet_is_left_alone():
+    content = (
+        "import React from 'react';\n"
+        "// seo:helmet-delegated\n"
+        "\n"
+        "const Tool = () => {\n"
+        "  return (\n"
+        "    <div>Tool</div>\n"
+        "  );\n"
+        "};\n"
+    )
+    assert inject_seo(content, METADATA) == (content, "already-present")
+
+
+def test_free_text_comment_does_not_delegate():
+    content = (
+        "import React from 'react';\n"
+        "// TODO: Helmet not handled by parent yet\n"
+        "\n"
+        "const Tool = () => {\n"
+        "  return (\n"
+        "    <div>Tool</div>\n"
+        "  );\n"
+        "};\n"
+    )
+    patched, status = inject_seo(content, METADATA)
+    assert status == "patched"
+    assert HELMET_IMPORT in patched
+
+
+def test_apostrophes_in_jsx_text():
+    content = (
+        "import React from 'react';\n"
+        "\n"
+        "const Tool = () => {\n"
+        "  const tip = () => {\n"
+        "    return (\n"
+        "      <div>Don't forget it's {count} days</div>\n"
+        "    );\n"
+        "  };\n"
+        "\n"
+        "  return (\n"
+        "    <div className=\"tool\">\n"
+        "      <p>You're done</p>\n"
+        "    </div>\n"
+        "  );\n"
+        "};\n"
+    )
+    root = scan_component(content)["root"]
+    assert content[:root].endswith('<div className="tool">')
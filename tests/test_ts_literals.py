@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from ts_literals import parse_exports
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCE = """
+import { Calculator } from 'lucide-react';
+
+export const siteConfig = {
+  name: 'Edurance Hub',
+  url: "https://edurancehub.com",
+};
+
+// A comment with a `backtick` and 'quote'
+export const defaultSEO = {
+  titleTemplate: `%s | ${siteConfig.name}`,
+  search: `${siteConfig.url}/search?q={search_term_string}`,
+  tags: ['a', "b", ...['c']],
+  icon: Calculator,
+  count: 3,
+  ratio: -1.5,
+  draft: false,
+  image: undefined,
+};
+
+export const pageSEO: Record<string, { title: string }> = {
+  ...{ home: { title: 'Home' } },
+  'about-us': { title: 'It\\'s us' },
+  siteConfig,
+};
+
+export const build = () => siteConfig;
+export const total = 1 + 2;
+"""
+
+
+def test_template_literals_resolve_earlier_constants():
+    exports = parse_exports(SOURCE)
+    assert exports["defaultSEO"]["titleTemplate"] == "%s | Edurance Hub"
+    assert exports["defaultSEO"]["search"] == "https://edurancehub.com/search?q={search_term_string}"
+
+
+def test_literals_spreads_and_shorthand():
+    exports = parse_exports(SOURCE)
+    seo = exports["defaultSEO"]
+    assert seo["tags"] == ["a", "b", "c"]
+    assert seo["icon"] == "Calculator"
+    assert (seo["count"], seo["ratio"], seo["draft"], seo["image"]) == (3, -1.5, False, None)
+    assert exports["pageSEO"] == {
+        "home": {"title": "Home"},
+        "about-us": {"title": "It's us"},
+        "siteConfig": exports["siteConfig"]
+    }
+
+
+def test_non_literals_are_skipped():
+    exports = parse_exports(SOURCE)
+    assert "build" not in exports
+    assert "total" not in exports
+
+
+@pytest.mark.skipif(not os.path.exists(os.path.join(ROOT, "src/config/seoConfig.ts")), reason="no seoConfig.ts")
+def test_reads_seo_config():
+    from ts_literals import read_exports
+    config = read_exports(os.path.join(ROOT, "src/config/seoConfig.ts"))
+    assert config["defaultSEO"]["titleTemplate"] == f"%s | {config['siteConfig']['name']}"
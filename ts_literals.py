@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Read exported constants out of TypeScript data modules.
+
+src/config/seoConfig.ts and src/data/blogData.ts hold plain object/array
+literals; this reads ``export const NAME[: Type] = <literal>;`` declarations
+into Python values so the build scripts can share them without a Node
+toolchain. Supported: objects (quoted or bare keys, shorthand properties,
+spreads), arrays (with spreads), strings including template literals whose
+``${...}`` parts are dotted references to earlier constants, numbers,
+true/false/null/undefined and references to earlier constants. Other
+identifiers (e.g. imported icon components) are kept as their name.
+Declarations that are not literals, such as functions, are skipped.
+"""
+
+import json
+import re
+
+TOKENS = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<template>`(?:[^`\\]|\\.)*`)
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<spread>\.\.\.)
+  | (?P<name>[A-Za-z_$][\w$]*(?:\s*\.\s*[A-Za-z_$][\w$]*)*)
+  | (?P<punct>[{}\[\](),:;=<>|?&!*/+-])
+""", re.S | re.X)
+
+EXPORT_CONST = re.compile(r"^export\s+const\s+([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*", re.M)
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.S)
+
+INTERPOLATION = re.compile(r"\$\{\s*([^}]*?)\s*\}")
+
+class LiteralError(ValueError):
+    """Raised when a declaration is not a supported literal"""
+
+def unescape(body):
+    """Resolve JavaScript string escapes"""
+    def replace(match):
+        escape = match.group(1)
+        if escape[0] == "u":
+            return chr(int(escape[1:].strip("{}"), 16))
+        if escape[0] == "x":
+            return chr(int(escape[1:], 16))
+        if escape == "\n":
+            return ""
+        return ESCAPES.get(escape, escape)
+    return ESCAPE.sub(replace, body)
+
+def tokenize(source, pos):
+    """Yield (kind, text, end) tokens from ``pos``, skipping whitespace and comments"""
+    while pos < len(source):
+        match = TOKENS.match(source, pos)
+        if match is None:
+            raise LiteralError(f"Unexpected character {source[pos]!r} at offset {pos}")
+        pos = match.end()
+        if match.lastgroup != "space":
+            yield match.lastgroup, match.group(), pos
+
+class Parser:
+    """Recursive-descent reader for one literal expression"""
+
+    def __init__(self, source, pos, scope):
+        self.tokens = tokenize(source, pos)
+        self.scope = scope
+        self.advance()
+
+    def advance(self):
+        self.kind, self.text, self.end = next(self.tokens, (None, None, None))
+
+    def expect(self, text):
+        if self.text != text:
+            raise LiteralError(f"Expected {text!r}, found {self.text!r}")
+        self.advance()
+
+    def resolve(self, name):
+        """Look up a dotted reference, or keep the bare name if it is unknown"""
+        parts = re.split(r"\s*\.\s*", name)
+        value = self.scope.get(parts[0], name)
+        for part in parts[1:]:
+            if not isinstance(value, dict) or part not in value:
+                return name
+            value = value[part]
+        return value
+
+    def value(self):
+        kind, text = self.kind, self.text
+        if text == "{":
+            return self.object()
+        if text == "[":
+            return self.array()
+        if text == "(":
+            raise LiteralError("Functions and expressions are not literals")
+        self.advance()
+
+        if kind == "string":
+            return unescape(text[1:-1])
+        if kind == "template":
+            return INTERPOLATION.sub(lambda m: str(self.resolve(m.group(1))), unescape(text[1:-1]))
+        if kind == "number":
+            return json.loads(text) if re.fullmatch(r"-?\d+", text) else float(text)
+        if kind == "name":
+            if text in ("true", "false"):
+                return text == "true"
+            if text in ("null", "undefined"):
+                return None
+            return self.resolve(text)
+        raise LiteralError(f"Unexpected token {text!r}")
+
+    def object(self):
+        self.expect("{")
+        result = {}
+        while self.text != "}":
+            if self.kind == "spread":
+                self.advance()
+                result.update(self.value())
+            else:
+                key = unescape(self.text[1:-1]) if self.kind == "string" else self.text
+                self.advance()
+                if self.text == ":":
+                    self.advance()
+                    result[key] = self.value()
+                else:
+                    result[key] = self.resolve(key)
+            if self.text == ",":
+                self.advance()
+            elif self.text != "}":
+                raise LiteralError(f"Expected ',' or '}}', found {self.text!r}")
+        self.advance()
+        return result
+
+    def array(self):
+        self.expect("[")
+        result = []
+        while self.text != "]":
+            if self.kind == "spread":
+                self.advance()
+                result.extend(self.value())
+            else:
+                result.append(self.value())
+            if self.text == ",":
+                self.advance()
+            elif self.text != "]":
+                raise LiteralError(f"Expected ',' or ']', found {self.text!r}")
+        self.advance()
+        return result
+
+def parse_exports(source):
+    """Return {name: value} for every exported literal constant in a TS source"""
+    scope = {}
+    for match in EXPORT_CONST.finditer(source):
+        try:
+            parser = Parser(source, match.end(), scope)
+            value = parser.value()
+        except (LiteralError, StopIteration):
+            continue
+        # Anything after the literal other than the end of the statement
+        # (e.g. a call or arithmetic) means this was not a plain literal
+        if parser.text not in (";", None, "export"):
+            continue
+        scope[match.group(1)] = value
+    return scope
+
+def read_exports(path):
+    """Read the exported literal constants from a TS file"""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_exports(f.read())